@@ -7,6 +7,8 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
+from titrack.api import dependencies
+from titrack.api.responses import ORJSONResponse
 from titrack.api.routes import cloud, icons, inventory, items, overlay, prices, runs, sessions, settings, stats, time, update
 from titrack.core.time_tracker import TimeTracker
 from titrack.api.schemas import PlayerResponse, StatusResponse
@@ -43,6 +45,7 @@ def create_app(
         title="TITrack API",
         description="Torchlight Infinite Local Loot Tracker API",
         version=__version__,
+        default_response_class=ORJSONResponse,
     )
 
     # CORS middleware for local development
@@ -60,20 +63,16 @@ def create_app(
         effective_id = get_effective_player_id(player_info)
         repo.set_player_context(player_info.season_id, effective_id)
 
-    # Dependency override for repository injection
-    def get_repository() -> Repository:
+    # Dependency override for repository injection. It only returns the shared
+    # instance, so it is async: FastAPI then calls it on the event loop instead of
+    # dispatching a sync dependency to the threadpool on every request. Results
+    # are already cached per request, so nested dependencies reuse it.
+    async def get_repository() -> Repository:
         return repo
 
-    # Apply dependency overrides to all routers
-    app.dependency_overrides[runs.get_repository] = get_repository
-    app.dependency_overrides[inventory.get_repository] = get_repository
-    app.dependency_overrides[items.get_repository] = get_repository
-    app.dependency_overrides[prices.get_repository] = get_repository
-    app.dependency_overrides[stats.get_repository] = get_repository
-    app.dependency_overrides[icons.get_repository] = get_repository
-    app.dependency_overrides[settings.get_repository] = get_repository
-    app.dependency_overrides[cloud.get_repository] = get_repository
-    app.dependency_overrides[sessions.get_repository] = get_repository
+    # Every router depends on the shared dependencies.get_repository, so one
+    # override covers them all
+    app.dependency_overrides[dependencies.get_repository] = get_repository
 
     # Include routers
     app.include_router(runs.router)
@@ -3,6 +3,12 @@
 Provides shared dependencies for API routes, configured by app factory.
 """
 
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Depends, Request
+
+from titrack.core.time_tracker import TimeTracker
 from titrack.db.repository import Repository
 
 
@@ -16,3 +22,24 @@ def get_repository() -> Repository:
         NotImplementedError: If not configured (should never happen in production)
     """
     raise NotImplementedError("Repository not configured")
+
+
+@dataclass(frozen=True)
+class RequestSettings:
+    """Settings read once per request (FastAPI caches dependency results per request)."""
+
+    map_costs_enabled: bool
+    tax_multiplier: float
+
+
+def get_request_settings(repo: Repository = Depends(get_repository)) -> RequestSettings:
+    """Dependency: map-cost and trade-tax settings for the current request."""
+    return RequestSettings(
+        map_costs_enabled=repo.get_setting("map_costs_enabled") == "true",
+        tax_multiplier=repo.get_trade_tax_multiplier(),
+    )
+
+
+def get_time_tracker(request: Request) -> Optional[TimeTracker]:
+    """Dependency: the app's time tracker (None if the app was built without one)."""
+    return getattr(request.app.state, "time_tracker", None)
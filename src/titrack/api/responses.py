@@ -0,0 +1,54 @@
+"""Shared JSON response classes for the API.
+
+ORJSONResponse is the app-wide default response class. It lives here because
+fastapi.responses.ORJSONResponse is deprecated in current FastAPI releases.
+
+Polling endpoints use etag_matches()/not_modified() to answer If-None-Match
+with an empty 304 instead of re-serializing an unchanged payload.
+
+Large list responses use model_json_response() so pydantic-core writes the
+JSON bytes directly, without an intermediate dict.
+"""
+
+from typing import Any, Optional
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to compact UTF-8 JSON bytes."""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads(raw: bytes | str) -> Any:
+    """Parse JSON bytes or text."""
+    return orjson.loads(raw)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def model_json_response(model: BaseModel) -> Response:
+    """JSON response serialized by the model's own (Rust) serializer."""
+    return Response(model.model_dump_json(), media_type="application/json")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the unchanged ETag."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
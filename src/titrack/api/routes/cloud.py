@@ -95,6 +95,33 @@ class CloudPriceHistoryResponse(BaseModel):
     history: list[PriceHistoryPoint]
 
 
+# Field projections for cached cloud rows (rows are already trusted dicts)
+_PRICE_KEYS = (
+    "config_base_id",
+    "season_id",
+    "price_fe_median",
+    "price_fe_p10",
+    "price_fe_p90",
+    "submission_count",
+    "unique_devices",
+    "cloud_updated_at",
+    "cached_at",
+)
+
+_HISTORY_KEYS = (
+    "hour_bucket",
+    "price_fe_median",
+    "price_fe_p10",
+    "price_fe_p90",
+    "submission_count",
+)
+
+
+def _project(rows: list[dict], keys: tuple[str, ...]) -> list[dict]:
+    """Project cached rows onto the given response keys (missing keys become None)."""
+    return [{k: r.get(k) for k in keys} for r in rows]
+
+
 class ItemsSyncResponse(BaseModel):
     """Response for items sync operation."""
 
@@ -205,35 +232,19 @@ def trigger_sync(
 def get_cloud_prices(
     request: Request,
     repo: Repository = Depends(get_repository),
-) -> CloudPriceListResponse:
+) -> dict:
     """Get cached cloud prices."""
     sync_manager = _get_sync_manager(request)
 
     if sync_manager is None:
-        return CloudPriceListResponse(prices=[], total=0)
+        return {"prices": [], "total": 0}
 
     # Get season from repository context
     season_id = repo._current_season_id
 
     prices = sync_manager.get_cached_cloud_prices(season_id)
 
-    return CloudPriceListResponse(
-        prices=[
-            CloudPriceResponse(
-                config_base_id=p["config_base_id"],
-                season_id=p["season_id"],
-                price_fe_median=p["price_fe_median"],
-                price_fe_p10=p.get("price_fe_p10"),
-                price_fe_p90=p.get("price_fe_p90"),
-                submission_count=p.get("submission_count"),
-                unique_devices=p.get("unique_devices"),
-                cloud_updated_at=p.get("cloud_updated_at"),
-                cached_at=p.get("cached_at"),
-            )
-            for p in prices
-        ],
-        total=len(prices),
-    )
+    return {"prices": _project(prices, _PRICE_KEYS), "total": len(prices)}
 
 
 @router.get("/debug")
@@ -284,35 +295,22 @@ def get_cloud_price_history(
     config_base_id: int,
     request: Request,
     repo: Repository = Depends(get_repository),
-) -> CloudPriceHistoryResponse:
+) -> dict:
     """Get price history for an item (for sparklines and charts)."""
     sync_manager = _get_sync_manager(request)
 
     season_id = repo._current_season_id or 0
 
     if sync_manager is None:
-        return CloudPriceHistoryResponse(
-            config_base_id=config_base_id,
-            season_id=season_id,
-            history=[],
-        )
+        return {"config_base_id": config_base_id, "season_id": season_id, "history": []}
 
     history = sync_manager.get_cached_price_history(config_base_id, season_id)
 
-    return CloudPriceHistoryResponse(
-        config_base_id=config_base_id,
-        season_id=season_id,
-        history=[
-            PriceHistoryPoint(
-                hour_bucket=h["hour_bucket"],
-                price_fe_median=h["price_fe_median"],
-                price_fe_p10=h.get("price_fe_p10"),
-                price_fe_p90=h.get("price_fe_p90"),
-                submission_count=h.get("submission_count"),
-            )
-            for h in history
-        ],
-    )
+    return {
+        "config_base_id": config_base_id,
+        "season_id": season_id,
+        "history": _project(history, _HISTORY_KEYS),
+    }
 
 
 @router.post("/items/sync", response_model=ItemsSyncResponse)
@@ -1,5 +1,6 @@
 """Icon proxy routes - fetches icons from CDN with proper headers."""
 
+import time
 import urllib.request
 import urllib.error
 from typing import Optional
@@ -15,7 +16,13 @@ from titrack.data.icon_urls import get_icon_url
 router = APIRouter(prefix="/api/icons", tags=["icons"])
 
 _icon_cache: dict[str, bytes] = {}
-_failed_urls: set[str] = set()
+# Negative cache: URL -> time.monotonic() expiry, so transient CDN failures self-heal
+_failed_urls: dict[str, float] = {}
+
+FAILED_TTL_TRANSIENT = 300  # timeouts, connection errors, 5xx
+FAILED_TTL_REJECTED = 3600  # 4xx, bad content type/size, not an image
+FAILED_TTL_BLOCKED = 86400  # domain not allowed
+MAX_FAILED_URLS = 10_000
 
 ALLOWED_DOMAINS = {"tlidb.com", "www.tlidb.com", "cdn.tlidb.com"}
 MAX_ICON_SIZE = 1024 * 1024  # 1MB
@@ -55,16 +62,25 @@ def _is_valid_image(data: bytes) -> bool:
     return False
 
 
+def _mark_failed(url: str, ttl: float) -> None:
+    """Negative-cache a URL for ttl seconds, sweeping expired entries when full."""
+    now = time.monotonic()
+    if len(_failed_urls) >= MAX_FAILED_URLS:
+        for expired in [u for u, expiry in _failed_urls.items() if expiry <= now]:
+            del _failed_urls[expired]
+    _failed_urls[url] = now + ttl
+
+
 def _fetch_icon(url: str) -> Optional[bytes]:
     """Fetch icon from CDN with security validation."""
-    if url in _failed_urls:
+    if _failed_urls.get(url, 0) > time.monotonic():
         return None
 
     if url in _icon_cache:
         return _icon_cache[url]
 
     if not _is_valid_domain(url):
-        _failed_urls.add(url)
+        _mark_failed(url, FAILED_TTL_BLOCKED)
         return None
 
     try:
@@ -72,27 +88,33 @@ def _fetch_icon(url: str) -> Optional[bytes]:
         with urllib.request.urlopen(req, timeout=10) as resp:
             content_type = resp.headers.get("Content-Type", "").split(";")[0].strip()
             if content_type and content_type not in ALLOWED_CONTENT_TYPES:
-                _failed_urls.add(url)
+                _mark_failed(url, FAILED_TTL_REJECTED)
                 return None
 
             content_length = resp.headers.get("Content-Length")
             if content_length and int(content_length) > MAX_ICON_SIZE:
-                _failed_urls.add(url)
+                _mark_failed(url, FAILED_TTL_REJECTED)
                 return None
 
             data = resp.read(MAX_ICON_SIZE + 1)
             if len(data) > MAX_ICON_SIZE:
-                _failed_urls.add(url)
+                _mark_failed(url, FAILED_TTL_REJECTED)
                 return None
 
             if not _is_valid_image(data):
-                _failed_urls.add(url)
+                _mark_failed(url, FAILED_TTL_REJECTED)
                 return None
 
             _icon_cache[url] = data
             return data
-    except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError, ValueError):
-        _failed_urls.add(url)
+    except urllib.error.HTTPError as e:
+        _mark_failed(url, FAILED_TTL_TRANSIENT if e.code >= 500 else FAILED_TTL_REJECTED)
+        return None
+    except (urllib.error.URLError, TimeoutError):
+        _mark_failed(url, FAILED_TTL_TRANSIENT)
+        return None
+    except ValueError:
+        _mark_failed(url, FAILED_TTL_REJECTED)
         return None
 
 
@@ -126,7 +148,7 @@ def get_icon(config_base_id: int, repo: Repository = Depends(get_repository)) ->
     elif icon_url.endswith(".jpg") or icon_url.endswith(".jpeg"):
         content_type = "image/jpeg"
 
-    return FastAPIResponse(
+    return Response(
         content=icon_data,
         media_type=content_type,
         headers={
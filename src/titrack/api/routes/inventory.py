@@ -1,12 +1,16 @@
 """Inventory API routes."""
 
+from collections import Counter
 from enum import Enum
+from itertools import islice
+from operator import itemgetter
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 
 from titrack.api.dependencies import get_repository
+from titrack.api.responses import model_json_response
 from titrack.api.schemas import InventoryItem, InventoryResponse
-from titrack.core.pricing import get_item_value, normalize_price
 from titrack.db.repository import Repository
 from titrack.parser.patterns import FE_CONFIG_BASE_ID
 
@@ -33,26 +37,25 @@ def _debug_slot_states(
 ) -> dict:
     """Debug endpoint to check slot_state data by PageId."""
     all_states = repo.get_all_slot_states(include_excluded=True)
-    
-    by_page = {}
-    for state in all_states:
-        page_id = state.page_id
-        if page_id not in by_page:
-            by_page[page_id] = []
-        by_page[page_id].append({
+
+    # Counter gives the per-page summary in one pass; only the 10 sampled
+    # PageId 103 entries are materialized
+    summary = Counter(state.page_id for state in all_states)
+    page_103_items = [
+        {
             "slot_id": state.slot_id,
             "config_base_id": state.config_base_id,
             "num": state.num,
             "player_id": state.player_id,
-        })
-    
-    summary = {page_id: len(items) for page_id, items in by_page.items()}
-    
+        }
+        for state in islice((s for s in all_states if s.page_id == 103), 10)
+    ]
+
     return {
         "total_states": len(all_states),
-        "by_page_count": summary,
+        "by_page_count": dict(summary),
         "current_player_id": repo._current_player_id,
-        "page_103_items": by_page.get(103, [])[:10],  # First 10 items from PageId 103
+        "page_103_items": page_103_items,  # First 10 items from PageId 103
     }
 
 
@@ -60,93 +63,112 @@ def _debug_slot_states(
 def get_inventory(
     sort_by: SortField = Query(SortField.VALUE, description="Field to sort by"),
     sort_order: SortOrder = Query(SortOrder.DESC, description="Sort order"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (default: all items)"),
+    offset: int = Query(0, ge=0, description="Number of sorted items to skip"),
     repo: Repository = Depends(get_repository),
-) -> InventoryResponse:
-    """Get current inventory state."""
-    states = repo.get_all_slot_states()
-
-    # Aggregate by item
-    totals: dict[int, int] = {}
-    for state in states:
-        if state.num > 0:
-            totals[state.config_base_id] = totals.get(state.config_base_id, 0) + state.num
+) -> Response:
+    """Get current inventory state (optionally one page of it)."""
+    # Aggregate by item (SUM ... GROUP BY in SQL)
+    totals = repo.get_inventory_totals()
 
     # Get trade tax multiplier (1.0 if disabled, 0.875 if enabled)
     tax_multiplier = repo.get_trade_tax_multiplier()
 
-    # Build response with prices
-    items = []
-    total_fe = totals.get(FE_CONFIG_BASE_ID, 0)
-    net_worth = float(total_fe)
+    # Build plain rows first; InventoryItem models are only created for the
+    # returned page. FE is handled up front (fixed 1.0 price, no tax, no price
+    # source) so the main loop only deals with tradeable items.
+    rows: list[dict] = []
+    total_fe = totals.pop(FE_CONFIG_BASE_ID, 0)
+    priced_values: list[float] = []
+
+    # Batch-load item metadata and effective prices (cloud-first, local overrides if newer)
+    config_ids = list(totals)
+    items_map = repo.get_items_bulk(config_ids + [FE_CONFIG_BASE_ID] if total_fe else config_ids)
+    prices_map = repo.get_effective_prices_with_source_bulk(config_ids)
+
+    if total_fe:
+        fe_item = items_map.get(FE_CONFIG_BASE_ID)
+        rows.append(
+            {
+                "config_base_id": FE_CONFIG_BASE_ID,
+                "name": repo.resolve_item_name(FE_CONFIG_BASE_ID, fe_item.name_en if fe_item else None),
+                "quantity": total_fe,
+                "icon_url": fe_item.icon_url if fe_item else None,
+                "price_fe": 1.0,
+                "total_value_fe": float(total_fe),
+                "price_source": None,
+            }
+        )
 
     for config_id, quantity in totals.items():
-        item = repo.get_item(config_id)
-
-        # Use effective price with source (cloud-first, local overrides if newer)
-        price_fe, price_source = repo.get_effective_price_with_source(config_id)
+        item = items_map.get(config_id)
+        price_fe, price_source = prices_map[config_id]
 
-        # Normalize FE price and calculate value with trade tax
-        price_fe = normalize_price(config_id, price_fe)
-        if config_id == FE_CONFIG_BASE_ID:
-            price_source = None  # FE has no price source
-            total_value = get_item_value(config_id, quantity, price_fe, apply_trade_tax=False)
+        # Apply trade tax to non-FE items (would need to sell them)
+        if price_fe is None:
+            total_value = None
         else:
-            # Apply trade tax to non-FE items (would need to sell them)
-            total_value = get_item_value(config_id, quantity, price_fe, apply_trade_tax=True, trade_tax_multiplier=tax_multiplier)
-
-        if total_value and config_id != FE_CONFIG_BASE_ID:
-            net_worth += total_value
-
-        items.append(
-            InventoryItem(
-                config_base_id=config_id,
-                name=repo.get_item_name(config_id),
-                quantity=quantity,
-                icon_url=item.icon_url if item else None,
-                price_fe=price_fe,
-                total_value_fe=total_value,
-                price_source=price_source,
-            )
+            total_value = price_fe * quantity * tax_multiplier
+            priced_values.append(total_value)
+
+        rows.append(
+            {
+                "config_base_id": config_id,
+                "name": repo.resolve_item_name(config_id, item.name_en if item else None),
+                "quantity": quantity,
+                "icon_url": item.icon_url if item else None,
+                "price_fe": price_fe,
+                "total_value_fe": total_value,
+                "price_source": price_source,
+            }
         )
 
-    # Sort based on parameters
+    # Net worth = FE + after-tax value of priced items, accumulated by the sum() builtin
+    net_worth = sum(priced_values, float(total_fe))
+
+    # Sort based on parameters. Keys are materialized once per item (FE always first,
+    # unpriced items last) and descending order is a sign flip, not a per-compare branch.
     reverse = sort_order == SortOrder.DESC
+    sign = -1 if reverse else 1
 
     if sort_by == SortField.VALUE:
-        # Sort by value, items without price go to end
-        items.sort(
-            key=lambda x: (
-                x.config_base_id != FE_CONFIG_BASE_ID,  # FE always first
-                x.total_value_fe is None,  # Items without price last
-                -(x.total_value_fe or 0) if reverse else (x.total_value_fe or 0),
+        keys = [
+            (
+                r["config_base_id"] != FE_CONFIG_BASE_ID,
+                r["total_value_fe"] is None,
+                sign * (r["total_value_fe"] or 0),
             )
-        )
+            for r in rows
+        ]
     elif sort_by == SortField.QUANTITY:
-        items.sort(
-            key=lambda x: (
-                x.config_base_id != FE_CONFIG_BASE_ID,  # FE always first
-                -x.quantity if reverse else x.quantity,
-            )
-        )
+        keys = [(r["config_base_id"] != FE_CONFIG_BASE_ID, sign * r["quantity"]) for r in rows]
     elif sort_by == SortField.NAME:
-        items.sort(
-            key=lambda x: (
-                x.config_base_id != FE_CONFIG_BASE_ID,  # FE always first
-                x.name.lower() if not reverse else "",
-            ),
-            reverse=reverse if sort_by == SortField.NAME else False,
-        )
-    elif sort_by == SortField.UNIT_PRICE:
-        items.sort(
-            key=lambda x: (
-                x.config_base_id != FE_CONFIG_BASE_ID,  # FE always first
-                x.price_fe is None,  # Items without price last
-                -(x.price_fe or 0) if reverse else (x.price_fe or 0),
+        # Strings can't be negated: sort names in the requested direction, then
+        # stable-sort FE to the front
+        names = [r["name"].lower() for r in rows]
+        order = sorted(range(len(rows)), key=names.__getitem__, reverse=reverse)
+        rows = [rows[i] for i in order]
+        keys = [r["config_base_id"] != FE_CONFIG_BASE_ID for r in rows]
+    else:  # SortField.UNIT_PRICE
+        keys = [
+            (
+                r["config_base_id"] != FE_CONFIG_BASE_ID,
+                r["price_fe"] is None,
+                sign * (r["price_fe"] or 0),
             )
+            for r in rows
+        ]
+
+    # Decorate-sort-undecorate on the prebuilt keys; only the requested page is modelled.
+    # Rows are built from DB values above, so skip per-row validation.
+    paired = sorted(zip(keys, rows), key=itemgetter(0))
+    end = offset + limit if limit is not None else None
+
+    return model_json_response(
+        InventoryResponse.model_construct(
+            items=[InventoryItem.model_construct(**row) for _, row in paired[offset:end]],
+            total_fe=total_fe,
+            net_worth_fe=round(net_worth, 2),
+            total=len(rows),
         )
-
-    return InventoryResponse(
-        items=items,
-        total_fe=total_fe,
-        net_worth_fe=round(net_worth, 2),
     )
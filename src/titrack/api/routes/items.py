@@ -1,8 +1,9 @@
 """Items API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 
 from titrack.api.dependencies import get_repository
+from titrack.api.responses import ORJSONResponse, etag_matches, not_modified
 from titrack.api.schemas import ItemListResponse, ItemResponse, ItemUpdateRequest
 from titrack.db.repository import Repository
 
@@ -11,43 +12,44 @@ router = APIRouter(prefix="/api/items", tags=["items"])
 
 @router.get("", response_model=ItemListResponse)
 def list_items(
+    request: Request,
     search: str = Query(None, description="Search by name"),
     limit: int = Query(100, le=1000),
     repo: Repository = Depends(get_repository),
-) -> ItemListResponse:
-    """List all items, optionally filtered by search term."""
-    all_items = repo.get_all_items()
-
-    # Filter by search if provided
-    if search:
-        search_lower = search.lower()
-        all_items = [
-            i
-            for i in all_items
-            if (i.name_en and search_lower in i.name_en.lower())
-            or (i.name_cn and search_lower in i.name_cn)
-        ]
-
-    # Sort by name
-    all_items.sort(key=lambda x: x.name_en or "")
-
-    # Apply limit
-    items = all_items[:limit]
-
-    return ItemListResponse(
-        items=[
-            ItemResponse(
-                config_base_id=i.config_base_id,
-                name_en=i.name_en,
-                name_cn=i.name_cn,
-                type_cn=i.type_cn,
-                icon_url=i.icon_url,
-                url_en=i.url_en,
-                url_cn=i.url_cn,
-            )
-            for i in items
-        ],
-        total=len(all_items),
+) -> Response:
+    """List all items, optionally filtered by search term.
+
+    The ETag follows the items revision, so repeated polls for the same query
+    get an empty 304 until an item is written.
+    """
+    etag = f'W/"{repo.items_revision()}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+
+    # IDs come back already filtered and sorted by name; only the page is loaded
+    matching_ids = repo.search_item_ids(search)
+    page_ids = matching_ids[:limit]
+    items_map = repo.get_items_bulk(page_ids)
+    items = [items_map[config_id] for config_id in page_ids if config_id in items_map]
+
+    # Shape matches ItemListResponse; rows come straight from the DB so skip re-validation
+    return ORJSONResponse(
+        {
+            "items": [
+                {
+                    "config_base_id": i.config_base_id,
+                    "name_en": i.name_en,
+                    "name_cn": i.name_cn,
+                    "type_cn": i.type_cn,
+                    "icon_url": i.icon_url,
+                    "url_en": i.url_en,
+                    "url_cn": i.url_cn,
+                }
+                for i in items
+            ],
+            "total": len(matching_ids),
+        },
+        headers={"ETag": etag, "Cache-Control": "no-cache"},
     )
 
 
@@ -61,7 +63,7 @@ def get_item(
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
 
-    return ItemResponse(
+    return ItemResponse.model_construct(
         config_base_id=item.config_base_id,
         name_en=item.name_en,
         name_cn=item.name_cn,
@@ -79,15 +81,14 @@ def update_item(
     repo: Repository = Depends(get_repository),
 ) -> ItemResponse:
     """Update an item's name."""
-    item = repo.get_item(config_base_id)
-    if not item:
-        raise HTTPException(status_code=404, detail="Item not found")
-
     if request.name_en is not None:
-        repo.update_item_name(config_base_id, request.name_en)
+        item = repo.update_item_name_returning(config_base_id, request.name_en)
+    else:
         item = repo.get_item(config_base_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
 
-    return ItemResponse(
+    return ItemResponse.model_construct(
         config_base_id=item.config_base_id,
         name_en=item.name_en,
         name_cn=item.name_cn,
@@ -1,27 +1,34 @@
 """Overlay configuration API routes.
 
-Provides GET/POST endpoints for the overlay subprocess to poll
-and for the main window to update overlay settings.
+Provides GET/POST endpoints for the overlay subprocess to poll. The main
+window lives in the same process as the app and calls get_config() /
+apply_config_update() directly instead of going through HTTP.
 """
 
-from typing import Optional
+import threading
+import time
+from typing import Any, Optional
 
-from fastapi import APIRouter, Request
-from pydantic import BaseModel
+from fastapi import APIRouter, Request, Response
+from pydantic import BaseModel, Field, field_validator
+
+from titrack.api.responses import ORJSONResponse, etag_matches, not_modified
 
 router = APIRouter(prefix="/api/overlay", tags=["overlay"])
 
-VALID_COLUMNS = [
+# Display order of overlay columns; VALID_COLUMNS is the O(1) membership set
+VALID_COLUMNS_ORDER = (
     "profit", "run_time", "total_profit", "total_time",
     "map_hr", "total_hr", "run_count", "contract",
-]
+)
+VALID_COLUMNS: frozenset[str] = frozenset(VALID_COLUMNS_ORDER)
 
 DEFAULT_CONFIG = {
     "opacity": 0.9,
     "scale": 1.0,
     "visible": True,
     "locked": True,
-    "visible_columns": list(VALID_COLUMNS),
+    "visible_columns": list(VALID_COLUMNS_ORDER),
     "text_shadow": True,
     "bg_opacity": 0.7,
     "preset": 1,
@@ -29,58 +36,89 @@ DEFAULT_CONFIG = {
 
 
 class OverlayConfigUpdate(BaseModel):
-    opacity: Optional[float] = None
-    scale: Optional[float] = None
+    opacity: Optional[float] = Field(None, ge=0.1, le=1.0)
+    scale: Optional[float] = Field(None, ge=0.8, le=1.5)
     visible: Optional[bool] = None
     locked: Optional[bool] = None
     visible_columns: Optional[list[str]] = None
     text_shadow: Optional[bool] = None
-    bg_opacity: Optional[float] = None
-    preset: Optional[int] = None
+    bg_opacity: Optional[float] = Field(None, ge=0.0, le=1.0)
+    preset: Optional[int] = Field(None, ge=1, le=3)
+
+    @field_validator("visible_columns")
+    @classmethod
+    def _drop_unknown_columns(cls, value: Optional[list[str]]) -> Optional[list[str]]:
+        """Silently drop column names the overlay doesn't know about."""
+        if value is None:
+            return None
+        return [c for c in value if c in VALID_COLUMNS]
+
+
+# Serializes read-modify-write of the config and its revision between the
+# API worker threads and in-process callers (the main window's JS bridge)
+_config_lock = threading.Lock()
 
 
-def _get_config(request: Request) -> dict:
-    """Get or initialize overlay config from app state."""
-    config = getattr(request.app.state, "overlay_config", None)
+def get_config(state: Any) -> dict:
+    """Get or initialize overlay config from app state.
+
+    Missing keys are back-filled from DEFAULT_CONFIG once per config object;
+    steady-state polls return the stored dict directly.
+    """
+    config = getattr(state, "overlay_config", None)
     if config is None:
         config = dict(DEFAULT_CONFIG)
-        request.app.state.overlay_config = config
-    # Ensure new fields exist (migration from older config)
-    for key, default_val in DEFAULT_CONFIG.items():
-        if key not in config:
-            config[key] = default_val
+        state.overlay_config = config
+        state.overlay_config_migrated = True
+        return config
+    if not getattr(state, "overlay_config_migrated", False):
+        # Ensure new fields exist (migration from older config)
+        for key, default_val in DEFAULT_CONFIG.items():
+            config.setdefault(key, default_val)
+        state.overlay_config_migrated = True
+    return config
+
+
+def _config_rev(state: Any) -> int:
+    """Get the overlay config revision, bumped on every update.
+
+    Seeded from the clock so ETags handed out by a previous run never match.
+    """
+    if not hasattr(state, "overlay_config_rev"):
+        state.overlay_config_rev = time.time_ns()
+    return state.overlay_config_rev
+
+
+def apply_config_update(state: Any, updates: OverlayConfigUpdate) -> dict:
+    """Merge a partial update into the config and bump its revision."""
+    with _config_lock:
+        config = get_config(state)
+        config.update(updates.model_dump(exclude_none=True))
+        state.overlay_config_rev = _config_rev(state) + 1
     return config
 
 
 @router.get("/config")
-def get_overlay_config(request: Request) -> dict:
-    """Get current overlay configuration."""
-    return _get_config(request)
+def get_overlay_config(request: Request) -> Response:
+    """Get current overlay configuration.
+
+    The overlay polls this endpoint; an unchanged config is answered with an
+    empty 304 when the request carries a matching If-None-Match.
+    """
+    state = request.app.state
+    with _config_lock:
+        config = get_config(state)
+        etag = f'W/"{_config_rev(state)}"'
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    return ORJSONResponse(config, headers={"ETag": etag, "Cache-Control": "no-cache"})
 
 
 @router.post("/config")
 def update_overlay_config(request: Request, updates: OverlayConfigUpdate) -> dict:
-    """Update overlay configuration (partial updates supported)."""
-    config = _get_config(request)
-
-    if updates.opacity is not None:
-        config["opacity"] = max(0.1, min(1.0, updates.opacity))
-    if updates.scale is not None:
-        config["scale"] = max(0.8, min(1.5, updates.scale))
-    if updates.visible is not None:
-        config["visible"] = updates.visible
-    if updates.locked is not None:
-        config["locked"] = updates.locked
-    if updates.visible_columns is not None:
-        config["visible_columns"] = [
-            c for c in updates.visible_columns if c in VALID_COLUMNS
-        ]
-    if updates.text_shadow is not None:
-        config["text_shadow"] = updates.text_shadow
-    if updates.bg_opacity is not None:
-        config["bg_opacity"] = max(0.0, min(1.0, updates.bg_opacity))
-    if updates.preset is not None:
-        config["preset"] = max(1, min(3, updates.preset))
-
-    request.app.state.overlay_config = config
-    return config
+    """Update overlay configuration (partial updates supported).
+
+    Range checks and column filtering happen in OverlayConfigUpdate; out-of-range
+    values are rejected with 422.
+    """
+    return apply_config_update(request.app.state, updates)
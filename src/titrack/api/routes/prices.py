@@ -1,13 +1,21 @@
 """Prices API routes."""
 
-from datetime import datetime
-from typing import Any
+from datetime import datetime, timezone
+from operator import attrgetter
+from typing import Iterator
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
 
 from titrack.api.dependencies import get_repository
-from titrack.api.schemas import PriceListResponse, PriceResponse, PriceUpdateRequest
+from titrack.api.responses import dumps, model_json_response
+from titrack.api.schemas import (
+    PriceBulkUpdateEntry,
+    PriceBulkUpdateResponse,
+    PriceListResponse,
+    PriceResponse,
+    PriceUpdateRequest,
+)
 from titrack.core.models import Price
 from titrack.db.repository import Repository
 
@@ -22,70 +30,76 @@ def get_exchange_price_ids(
     return repo.get_exchange_price_ids()
 
 
+def _priced_items(repo: Repository) -> list[PriceResponse]:
+    """Build price responses for the current season, sorted by display name.
+
+    Values come straight from the database, so models are built without validation.
+    """
+    prices = [
+        PriceResponse.model_construct(
+            config_base_id=price.config_base_id,
+            name=repo.resolve_item_name(price.config_base_id, name_en),
+            price_fe=price.price_fe,
+            source=price.source,
+            updated_at=price.updated_at,
+        )
+        for price, name_en in repo.get_prices_with_names()
+    ]
+    prices.sort(key=attrgetter("name"))
+    return prices
+
+
 @router.get("", response_model=PriceListResponse)
 def list_prices(
     repo: Repository = Depends(get_repository),
-) -> PriceListResponse:
-    """List all item prices."""
-    all_prices = repo.get_all_prices()
-
-    prices = []
-    for price in all_prices:
-        item = repo.get_item(price.config_base_id)
-        prices.append(
-            PriceResponse(
-                config_base_id=price.config_base_id,
-                name=repo.get_item_name(price.config_base_id),
-                price_fe=price.price_fe,
-                source=price.source,
-                updated_at=price.updated_at,
-            )
+) -> Response:
+    """List all item prices (serialized straight to JSON by pydantic-core)."""
+    prices = _priced_items(repo)
+
+    return model_json_response(
+        PriceListResponse.model_construct(
+            prices=prices,
+            total=len(prices),
         )
-
-    # Sort by name
-    prices.sort(key=lambda x: x.name)
-
-    return PriceListResponse(
-        prices=prices,
-        total=len(prices),
     )
 
 
-@router.get("/export")
-def export_prices(
-    repo: Repository = Depends(get_repository),
-) -> JSONResponse:
-    """Export all prices as a seed-compatible JSON file."""
-    all_prices = repo.get_all_prices()
-
-    prices_data = []
-    for price in all_prices:
-        item = repo.get_item(price.config_base_id)
-        prices_data.append({
+def _export_chunks(repo: Repository) -> Iterator[bytes]:
+    """Yield the seed-compatible export JSON piece by piece (one price per chunk)."""
+    meta = {
+        "exported_at_utc": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "count": repo.get_price_count(),
+        "notes": [
+            "Price seed file for TITrack.",
+            "Prices are in FE (Flame Elementium).",
+            "These values will be overwritten when users search the AH.",
+        ],
+    }
+    yield b'{"meta":' + dumps(meta) + b',"prices":['
+
+    # Rows arrive sorted by name for readability (unknown names first)
+    separator = b""
+    for price, name_en in repo.iter_prices_with_names():
+        row = {
             "id": str(price.config_base_id),
-            "name_en": item.name_en if item else None,
+            "name_en": name_en,
             "price_fe": price.price_fe,
             "source": price.source,
-        })
-
-    # Sort by name for readability
-    prices_data.sort(key=lambda x: x.get("name_en") or "")
-
-    export_data: dict[str, Any] = {
-        "meta": {
-            "exported_at_utc": datetime.utcnow().isoformat() + "Z",
-            "count": len(prices_data),
-            "notes": [
-                "Price seed file for TITrack.",
-                "Prices are in FE (Flame Elementium).",
-                "These values will be overwritten when users search the AH.",
-            ],
-        },
-        "prices": prices_data,
-    }
+        }
+        yield separator + dumps(row)
+        separator = b","
 
-    return JSONResponse(
-        content=export_data,
+    yield b"]}"
+
+
+@router.get("/export")
+def export_prices(
+    repo: Repository = Depends(get_repository),
+) -> StreamingResponse:
+    """Export all prices as a seed-compatible JSON file (streamed)."""
+    return StreamingResponse(
+        _export_chunks(repo),
+        media_type="application/json",
         headers={
             "Content-Disposition": "attachment; filename=titrack_prices_seed.json"
         },
@@ -116,22 +130,9 @@ def migrate_legacy_prices(
     migrated = repo.migrate_legacy_prices(repo._current_season_id)
 
     # Return updated price list
-    all_prices = repo.get_all_prices()
-    prices = []
-    for price in all_prices:
-        item = repo.get_item(price.config_base_id)
-        prices.append(
-            PriceResponse(
-                config_base_id=price.config_base_id,
-                name=repo.get_item_name(price.config_base_id),
-                price_fe=price.price_fe,
-                source=price.source,
-                updated_at=price.updated_at,
-            )
-        )
-    prices.sort(key=lambda x: x.name)
+    prices = _priced_items(repo)
 
-    return MigratePricesResponse(
+    return MigratePricesResponse.model_construct(
         prices=prices,
         total=len(prices),
         migrated=migrated,
@@ -150,7 +151,7 @@ def get_price(
 
     item = repo.get_item(config_base_id)
 
-    return PriceResponse(
+    return PriceResponse.model_construct(
         config_base_id=price.config_base_id,
         name=repo.get_item_name(price.config_base_id),
         price_fe=price.price_fe,
@@ -159,6 +160,36 @@ def get_price(
     )
 
 
+def _price_from_request(
+    repo: Repository, config_base_id: int, request: PriceUpdateRequest, now: datetime
+) -> Price:
+    """Build a Price for the current season; `now` is read once per request, not per entry."""
+    updated_at = request.updated_at or now
+    if updated_at.tzinfo is not None:
+        # Stored timestamps are naive local time
+        updated_at = updated_at.astimezone().replace(tzinfo=None)
+    return Price(
+        config_base_id=config_base_id,
+        price_fe=request.price_fe,
+        source=request.source,
+        updated_at=updated_at,
+        season_id=repo._current_season_id,  # Tag with current season
+    )
+
+
+@router.put("/bulk", response_model=PriceBulkUpdateResponse)
+def update_prices_bulk(
+    entries: list[PriceBulkUpdateEntry],
+    repo: Repository = Depends(get_repository),
+) -> PriceBulkUpdateResponse:
+    """Update or create many prices in one transaction."""
+    now = datetime.now()
+    repo.upsert_prices_batch(
+        [_price_from_request(repo, entry.config_base_id, entry, now) for entry in entries]
+    )
+    return PriceBulkUpdateResponse(updated=len(entries))
+
+
 @router.put("/{config_base_id}", response_model=PriceResponse)
 def update_price(
     config_base_id: int,
@@ -166,22 +197,13 @@ def update_price(
     repo: Repository = Depends(get_repository),
 ) -> PriceResponse:
     """Update or create a price for an item."""
-    # Verify item exists (optional, allows pricing unknown items)
-    item = repo.get_item(config_base_id)
-
-    price = Price(
-        config_base_id=config_base_id,
-        price_fe=request.price_fe,
-        source=request.source,
-        updated_at=datetime.now(),
-        season_id=repo._current_season_id,  # Tag with current season
-    )
-    repo.upsert_price(price)
+    price = _price_from_request(repo, config_base_id, request, datetime.now())
+    repo.upsert_prices_batch([price])
 
-    return PriceResponse(
+    return PriceResponse.model_construct(
         config_base_id=config_base_id,
         name=repo.get_item_name(config_base_id),
         price_fe=price.price_fe,
         source=price.source,
         updated_at=price.updated_at,
-    )
\ No newline at end of file
+    )
@@ -1,24 +1,29 @@
 """Runs API routes."""
 
-from typing import Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import Response
+import csv
+import io
+from dataclasses import dataclass, fields as dataclass_fields
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterator, Mapping, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from datetime import date
 
-from titrack.api.dependencies import get_repository
+from titrack.api.dependencies import RequestSettings, get_repository, get_request_settings
+from titrack.api.responses import model_json_response
 from titrack.api.schemas import (
     ActiveRunResponse,
-    LootItem,
-    LootReportItem,
+    LootItemDict,
     LootReportResponse,
     PerformanceStatsResponse,
     RunListResponse,
     RunResponse,
     RunStatsResponse,
 )
-from titrack.core.models import Run
+from titrack.core.models import Item, Run
 from titrack.core.pricing import get_item_value, normalize_price
 from titrack.data.zones import get_zone_display_name
 from titrack.db.repository import Repository
@@ -26,6 +31,18 @@ from titrack.parser.patterns import FE_CONFIG_BASE_ID
 
 router = APIRouter(prefix="/api/runs", tags=["runs"])
 
+# Zone tables are static, and a runs page repeats the same few (signature, level_id) pairs
+_zone_name = lru_cache(maxsize=2048)(get_zone_display_name)
+
+
+@lru_cache(maxsize=2048)
+def _nightmare_zone_name(zone_signature: str, level_id: Optional[int]) -> str:
+    """Zone display name with the nightmare suffix, built once per zone."""
+    return _zone_name(zone_signature, level_id) + " (Nightmare)"
+
+# Cost entry for runs whose costs weren't loaded (map costs disabled)
+_NO_COSTS: tuple[dict[int, int], float, list[int]] = ({}, 0.0, [])
+
 # Level type constants (from game logs)
 LEVEL_TYPE_NORMAL = 3
 LEVEL_TYPE_NIGHTMARE = 11
@@ -39,128 +56,140 @@ class ResetResponse(BaseModel):
     message: str
 
 
-def _build_loot(summary: dict[int, int], repo: Repository) -> list[LootItem]:
-    """Build loot items from a run summary."""
+def _lookup_maps(
+    repo: Repository, *summaries: Mapping[int, int]
+) -> tuple[dict[int, Item], dict[int, Optional[float]]]:
+    """Batch-load item metadata and effective prices for every item in the given summaries."""
+    config_ids = list({config_id for summary in summaries for config_id in summary})
+    return repo.get_items_bulk(config_ids), repo.get_effective_prices_bulk(config_ids)
+
+
+def _build_loot(
+    summary: Mapping[int, int],
+    repo: Repository,
+    items_map: dict[int, Item],
+    prices_map: dict[int, Optional[float]],
+) -> list[LootItemDict]:
+    """Build loot items from a run summary using pre-fetched item and price maps.
+
+    Entries are ordered by |quantity| (descending) before any row is built.
+    """
+    entries = [
+        (abs(quantity), config_id, quantity)
+        for config_id, quantity in summary.items()
+        if quantity != 0
+    ]
+    entries.sort(key=itemgetter(0), reverse=True)
+
     loot = []
-    for config_id, quantity in summary.items():
-        if quantity != 0:
-            item = repo.get_item(config_id)
-
-            # Use effective price (cloud-first, local overrides if newer)
-            item_price_fe = normalize_price(config_id, repo.get_effective_price(config_id))
-            item_total = get_item_value(config_id, quantity, item_price_fe, apply_trade_tax=False)
-            loot.append(
-                LootItem(
-                    config_base_id=config_id,
-                    name=repo.get_item_name(config_id),
-                    quantity=quantity,
-                    icon_url=item.icon_url if item else None,
-                    price_fe=item_price_fe,
-                    total_value_fe=round(item_total, 2) if item_total else None,
-                )
-            )
-    return sorted(loot, key=lambda x: abs(x.quantity), reverse=True)
+    for _, config_id, quantity in entries:
+        item = items_map.get(config_id)
+
+        # Use effective price (cloud-first, local overrides if newer)
+        item_price_fe = normalize_price(config_id, prices_map.get(config_id))
+        item_total = get_item_value(config_id, quantity, item_price_fe, apply_trade_tax=False)
+        loot.append(
+            {
+                "config_base_id": config_id,
+                "name": repo.resolve_item_name(config_id, item.name_en if item else None),
+                "quantity": quantity,
+                "icon_url": item.icon_url if item else None,
+                "price_fe": item_price_fe,
+                "total_value_fe": round(item_total, 2) if item_total else None,
+            }
+        )
+    return loot
 
 
-def _build_cost_items(cost_summary: dict[int, int], repo: Repository) -> list[LootItem]:
-    """Build cost items from a run's map cost summary."""
-    cost_items = []
+def _build_cost_items(
+    cost_summary: Mapping[int, int],
+    repo: Repository,
+    items_map: dict[int, Item],
+    prices_map: dict[int, Optional[float]],
+) -> list[LootItemDict]:
+    """Build cost items from a run's map cost summary using pre-fetched item and price maps.
+
+    Entries are ordered by |total value| (descending) before any row is built.
+    """
+    entries = []
     for config_id, quantity in cost_summary.items():
         if quantity != 0:
-            item = repo.get_item(config_id)
-            item_price_fe = normalize_price(config_id, repo.get_effective_price(config_id))
+            item_price_fe = normalize_price(config_id, prices_map.get(config_id))
             # Use absolute quantity for display (costs are negative)
-            abs_qty = abs(quantity)
-            item_total = get_item_value(config_id, abs_qty, item_price_fe, apply_trade_tax=False)
-            cost_items.append(
-                LootItem(
-                    config_base_id=config_id,
-                    name=repo.get_item_name(config_id),
-                    quantity=quantity,  # Keep negative to indicate consumption
-                    icon_url=item.icon_url if item else None,
-                    price_fe=item_price_fe,
-                    total_value_fe=round(item_total, 2) if item_total else None,
-                )
+            item_total = get_item_value(
+                config_id, abs(quantity), item_price_fe, apply_trade_tax=False
+            )
+            total_value_fe = round(item_total, 2) if item_total else None
+            entries.append(
+                (abs(total_value_fe or 0), config_id, quantity, item_price_fe, total_value_fe)
             )
-    return sorted(cost_items, key=lambda x: abs(x.total_value_fe or 0), reverse=True)
+    entries.sort(key=itemgetter(0), reverse=True)
 
+    cost_items = []
+    for _, config_id, quantity, item_price_fe, total_value_fe in entries:
+        item = items_map.get(config_id)
+        cost_items.append(
+            {
+                "config_base_id": config_id,
+                "name": repo.resolve_item_name(config_id, item.name_en if item else None),
+                "quantity": quantity,  # Keep negative to indicate consumption
+                "icon_url": item.icon_url if item else None,
+                "price_fe": item_price_fe,
+                "total_value_fe": total_value_fe,
+            }
+        )
+    return cost_items
 
-def _consolidate_runs(
-    all_runs_including_hubs: list[Run],
+
+def _build_session_responses(
+    sessions: list[list[Run]],
     repo: Repository,
     map_costs_enabled: bool = False,
+    tax_multiplier: Optional[float] = None,
 ) -> list[RunResponse]:
     """
-    Consolidate runs from the same map instance.
-
-    Runs are only consolidated if they:
-    1. Have the same level_uid (same map instance)
-    2. Are consecutive (no hub visit in between)
+    Build RunResponses for sessions from Repository.get_run_entries_page, newest first.
 
-    Normal runs (level_type=3) are merged into one entry.
+    Normal runs (level_type=3) of a session are merged into one entry.
     Nightmare runs (level_type=11) are kept separate with is_nightmare=True.
 
     This handles the Twinightmare mechanic where entering nightmare
     creates a zone transition but it's part of the same map run.
     """
-    # Sort all runs by start time (ascending) to detect consecutive runs
-    sorted_runs = sorted(all_runs_including_hubs, key=lambda r: r.start_ts)
-
-    # Build sessions: consecutive non-hub runs with same level_uid
-    # A hub run breaks the session
-    sessions: list[list[Run]] = []
-    current_session: list[Run] = []
-    current_uid: Optional[int] = None
-
-    for run in sorted_runs:
-        if run.is_hub:
-            # Hub breaks the session
-            if current_session:
-                sessions.append(current_session)
-                current_session = []
-                current_uid = None
-        else:
-            # Non-hub run
-            if run.level_uid is None:
-                # No level_uid - treat as its own session
-                if current_session:
-                    sessions.append(current_session)
-                sessions.append([run])
-                current_session = []
-                current_uid = None
-            elif run.level_uid == current_uid:
-                # Same level_uid, add to current session
-                current_session.append(run)
-            else:
-                # Different level_uid, start new session
-                if current_session:
-                    sessions.append(current_session)
-                current_session = [run]
-                current_uid = run.level_uid
-
-    # Don't forget the last session
-    if current_session:
-        sessions.append(current_session)
+    # Summaries, values and costs for every non-hub run in three batched queries
+    run_ids_to_load = [r.id for session_runs in sessions for r in session_runs]
+    summaries = repo.get_run_summaries_batch(run_ids_to_load)
+    values = repo.get_run_values_batch(run_ids_to_load, summaries, tax_multiplier)
+    costs = repo.get_run_costs_batch(run_ids_to_load) if map_costs_enabled else {}
 
-    result = []
+    # (RunResponse fields, loot summary, cost summary or None) per output row;
+    # loot and cost items are built once all summaries are known
+    pending: list[tuple[dict, Mapping[int, int], Optional[Mapping[int, int]]]] = []
 
     for session_runs in sessions:
         if not session_runs:
             continue
 
         # Separate nightmare runs from normal runs within the session
-        normal_runs = [r for r in session_runs if r.level_type != LEVEL_TYPE_NIGHTMARE]
-        nightmare_runs = [r for r in session_runs if r.level_type == LEVEL_TYPE_NIGHTMARE]
+        normal_runs: list[Run] = []
+        nightmare_runs: list[Run] = []
+        for r in session_runs:
+            (nightmare_runs if r.level_type == LEVEL_TYPE_NIGHTMARE else normal_runs).append(r)
 
         # Consolidate normal runs into one entry
         if normal_runs:
-            # Use the first run's metadata, but aggregate values
-            first_run = min(normal_runs, key=lambda r: r.start_ts)
-            last_run = max(normal_runs, key=lambda r: r.end_ts or r.start_ts)
+            # Use the first run's metadata, but aggregate values. Sessions are built
+            # from runs sorted by start_ts, so the first normal run starts earliest;
+            # the latest end is tracked in the aggregation loop below.
+            first_run = normal_runs[0]
+            last_run = first_run
 
             # Aggregate summaries
-            combined_summary: dict[int, int] = defaultdict(int)
-            combined_cost_summary: dict[int, int] = defaultdict(int)
+            # Keys are known up front from the batched summaries, so preallocate
+            # (insertion order matches first appearance, as a defaultdict would)
+            combined_summary = dict.fromkeys(
+                (config_id for run in normal_runs for config_id in summaries.get(run.id, ())), 0
+            )
             total_fe = 0
             total_value = 0.0
             total_cost = 0.0
@@ -170,92 +199,120 @@ def _consolidate_runs(
 
             for run in normal_runs:
                 run_ids.append(run.id)
-                summary = repo.get_run_summary(run.id)
-                for config_id, qty in summary.items():
+                if (run.end_ts or run.start_ts) > (last_run.end_ts or last_run.start_ts):
+                    last_run = run
+                for config_id, qty in summaries.get(run.id, {}).items():
                     combined_summary[config_id] += qty
-                fe, value = repo.get_run_value(run.id)
+                fe, value = values[run.id]
                 total_fe += fe
                 total_value += value
                 if run.duration_seconds:
                     total_duration += run.duration_seconds
 
-                # Aggregate costs if enabled
-                if map_costs_enabled:
-                    cost_summary, cost_value, unpriced = repo.get_run_cost(run.id)
-                    for config_id, qty in cost_summary.items():
+            # Aggregate costs in their own pass, only when enabled, so the loop
+            # above has no per-run settings branch
+            combined_cost_summary: dict[int, int] = {}
+            if map_costs_enabled:
+                combined_cost_summary = dict.fromkeys(
+                    (config_id for run in normal_runs for config_id in costs[run.id][0]), 0
+                )
+                for run in normal_runs:
+                    run_cost_summary, cost_value, unpriced = costs[run.id]
+                    for config_id, qty in run_cost_summary.items():
                         combined_cost_summary[config_id] += qty
                     total_cost += cost_value
                     if unpriced:
                         has_unpriced_costs = True
 
-            # Build cost items if enabled
-            cost_items = None
+            # Cost items are built after the batch lookup below
+            cost_summary = None
             cost_fe = None
             net_value = None
-            if map_costs_enabled and combined_cost_summary:
-                cost_items = _build_cost_items(dict(combined_cost_summary), repo)
+            if combined_cost_summary:
+                cost_summary = combined_cost_summary
                 cost_fe = round(total_cost, 2)
                 net_value = round(total_value - total_cost, 2)
 
-            result.append(
-                RunResponse(
-                    id=first_run.id,  # Use first run's ID as primary
-                    zone_name=get_zone_display_name(first_run.zone_signature, first_run.level_id),
-                    zone_signature=first_run.zone_signature,
-                    start_ts=first_run.start_ts,
-                    end_ts=last_run.end_ts,
-                    duration_seconds=total_duration if total_duration > 0 else None,
-                    is_hub=first_run.is_hub,
-                    is_nightmare=False,
-                    fe_gained=total_fe,
-                    total_value=round(total_value, 2),
-                    loot=_build_loot(dict(combined_summary), repo),
-                    consolidated_run_ids=run_ids if len(run_ids) > 1 else None,
-                    map_cost_items=cost_items,
-                    map_cost_fe=cost_fe,
-                    map_cost_has_unpriced=has_unpriced_costs,
-                    net_value_fe=net_value,
+            pending.append(
+                (
+                    dict(
+                        id=first_run.id,  # Use first run's ID as primary
+                        zone_name=_zone_name(first_run.zone_signature, first_run.level_id),
+                        zone_signature=first_run.zone_signature,
+                        start_ts=first_run.start_ts,
+                        end_ts=last_run.end_ts,
+                        duration_seconds=total_duration if total_duration > 0 else None,
+                        is_hub=first_run.is_hub,
+                        is_nightmare=False,
+                        fe_gained=total_fe,
+                        total_value=round(total_value, 2),
+                        consolidated_run_ids=run_ids if len(run_ids) > 1 else None,
+                        map_cost_fe=cost_fe,
+                        map_cost_has_unpriced=has_unpriced_costs,
+                        net_value_fe=net_value,
+                    ),
+                    combined_summary,
+                    cost_summary,
                 )
             )
 
         # Keep nightmare runs separate
         for run in nightmare_runs:
-            summary = repo.get_run_summary(run.id)
-            fe_gained, total_value = repo.get_run_value(run.id)
+            summary = summaries.get(run.id, {})
+            fe_gained, total_value = values[run.id]
 
-            # Get costs if enabled
-            cost_items = None
+            # Costs were only loaded when enabled; otherwise this is the empty default
+            cost_summary = None
             cost_fe = None
             net_value = None
             has_unpriced_costs = False
-            if map_costs_enabled:
-                cost_summary, cost_value, unpriced = repo.get_run_cost(run.id)
-                if cost_summary:
-                    cost_items = _build_cost_items(cost_summary, repo)
-                    cost_fe = round(cost_value, 2)
-                    net_value = round(total_value - cost_value, 2)
-                    has_unpriced_costs = bool(unpriced)
-
-            result.append(
-                RunResponse(
-                    id=run.id,
-                    zone_name=get_zone_display_name(run.zone_signature, run.level_id) + " (Nightmare)",
-                    zone_signature=run.zone_signature,
-                    start_ts=run.start_ts,
-                    end_ts=run.end_ts,
-                    duration_seconds=run.duration_seconds,
-                    is_hub=run.is_hub,
-                    is_nightmare=True,
-                    fe_gained=fe_gained,
-                    total_value=round(total_value, 2),
-                    loot=_build_loot(summary, repo),
-                    map_cost_items=cost_items,
-                    map_cost_fe=cost_fe,
-                    map_cost_has_unpriced=has_unpriced_costs,
-                    net_value_fe=net_value,
+            run_cost_summary, cost_value, unpriced = costs.get(run.id, _NO_COSTS)
+            if run_cost_summary:
+                cost_summary = run_cost_summary
+                cost_fe = round(cost_value, 2)
+                net_value = round(total_value - cost_value, 2)
+                has_unpriced_costs = bool(unpriced)
+
+            pending.append(
+                (
+                    dict(
+                        id=run.id,
+                        zone_name=_nightmare_zone_name(run.zone_signature, run.level_id),
+                        zone_signature=run.zone_signature,
+                        start_ts=run.start_ts,
+                        end_ts=run.end_ts,
+                        duration_seconds=run.duration_seconds,
+                        is_hub=run.is_hub,
+                        is_nightmare=True,
+                        fe_gained=fe_gained,
+                        total_value=round(total_value, 2),
+                        map_cost_fe=cost_fe,
+                        map_cost_has_unpriced=has_unpriced_costs,
+                        net_value_fe=net_value,
+                    ),
+                    summary,
+                    cost_summary,
                 )
             )
 
+    # One item/price lookup for every loot and cost item across all runs
+    items_map, prices_map = _lookup_maps(
+        repo, *(summary for _, summary, _ in pending), *(cost for _, _, cost in pending if cost)
+    )
+    # Fields come from DB rows and the builders above, so models skip validation
+    result = [
+        RunResponse.model_construct(
+            **fields,
+            loot=_build_loot(summary, repo, items_map, prices_map),
+            map_cost_items=(
+                _build_cost_items(cost_summary, repo, items_map, prices_map)
+                if cost_summary is not None
+                else None
+            ),
+        )
+        for fields, summary, cost_summary in pending
+    ]
+
     # Sort by start time descending
     result.sort(key=lambda r: r.start_ts, reverse=True)
     return result
@@ -272,8 +329,13 @@ def list_runs(
     page_size: int = 20,
     exclude_hubs: bool = True,
     repo: Repository = Depends(get_repository),
-) -> RunListResponse:
-    """List recent runs with pagination and consolidation."""
+    settings: RequestSettings = Depends(get_request_settings),
+) -> Response:
+    """List recent runs with pagination and consolidation.
+
+    The page is written straight to JSON by pydantic-core (no response
+    re-validation or intermediate dicts).
+    """
     # Validate pagination parameters
     if page < 1:
         page = 1
@@ -284,28 +346,26 @@ def list_runs(
     if page_size > MAX_PAGE_SIZE:
         raise HTTPException(status_code=400, detail=f"page_size cannot exceed {MAX_PAGE_SIZE}")
 
-    # Get more runs than needed to handle filtering and consolidation
-    fetch_limit = page_size * 5
     offset = (page - 1) * page_size
 
-    # Check if map costs are enabled
-    map_costs_enabled = repo.get_setting("map_costs_enabled") == "true"
-
-    # Fetch all runs INCLUDING hubs for session detection
-    all_runs = repo.get_recent_runs(limit=fetch_limit + offset * 2)
-
-    # Consolidate runs (merges normal runs in same map instance, uses hubs to detect session breaks)
-    # This function receives all runs including hubs but only returns non-hub consolidated results
-    consolidated = _consolidate_runs(all_runs, repo, map_costs_enabled=map_costs_enabled)
-
-    # Apply pagination to consolidated results
-    paginated = consolidated[offset : offset + page_size]
+    # Sessions are assigned and paginated in SQL; only this page's runs are loaded.
+    # Each entry is one consolidated normal-run group or one nightmare run.
+    entries, total = repo.get_run_entries_page(limit=page_size, offset=offset)
+    paginated = _build_session_responses(
+        entries,
+        repo,
+        map_costs_enabled=settings.map_costs_enabled,
+        tax_multiplier=settings.tax_multiplier,
+    )
 
-    return RunListResponse(
-        runs=paginated,
-        total=len(consolidated),
-        page=page,
-        page_size=page_size,
+    # Entries are already-built RunResponse models; no need to re-check the list
+    return model_json_response(
+        RunListResponse.model_construct(
+            runs=paginated,
+            total=total,
+            page=page,
+            page_size=page_size,
+        )
     )
 
 
@@ -313,34 +373,34 @@ def list_runs(
 def get_stats(
     exclude_hubs: bool = True,
     repo: Repository = Depends(get_repository),
+    settings: RequestSettings = Depends(get_request_settings),
 ) -> RunStatsResponse:
     """Get summary statistics for all runs."""
-    # Check if map costs are enabled
-    map_costs_enabled = repo.get_setting("map_costs_enabled") == "true"
+    map_costs_enabled = settings.map_costs_enabled
 
     all_runs = repo.get_recent_runs(limit=1000)
 
     if exclude_hubs:
         all_runs = [r for r in all_runs if not r.is_hub]
 
+    # Values and costs for all runs in batched queries (prices resolved once)
+    run_ids = [run.id for run in all_runs]
+    run_values = repo.get_run_values_batch(run_ids, tax_multiplier=settings.tax_multiplier)
+    run_costs = repo.get_run_costs_batch(run_ids) if map_costs_enabled else {}
+
     total_fe = 0
     total_value = 0.0
-    total_cost = 0.0
     total_duration = 0.0
 
     for run in all_runs:
-        fe_gained, run_value = repo.get_run_value(run.id)
+        fe_gained, run_value = run_values[run.id]
         total_fe += fe_gained
         total_value += run_value
         if run.duration_seconds:
             total_duration += run.duration_seconds
 
-        # Subtract costs if enabled
-        if map_costs_enabled:
-            _, cost_value, _ = repo.get_run_cost(run.id)
-            total_cost += cost_value
-
-    # Use net value if costs are enabled
+    # Use net value if costs are enabled (run_costs is empty otherwise)
+    total_cost = sum(cost_value for _, cost_value, _ in run_costs.values())
     net_value = total_value - total_cost if map_costs_enabled else total_value
 
     total_runs = len(all_runs)
@@ -365,6 +425,7 @@ def get_stats(
 def get_performance_stats(
     request: Request,
     repo: Repository = Depends(get_repository),
+    settings: RequestSettings = Depends(get_request_settings),
 ) -> PerformanceStatsResponse:
     """Get performance statistics based on time tracking and profit data."""
     # Get time tracker from app state
@@ -380,37 +441,33 @@ def get_performance_stats(
     # Get run count and loot data
     run_count = repo.get_completed_run_count()
     
-    # Get total duration of completed runs only (for live average calculation)
-    completed_runs = repo.get_recent_runs(limit=10000)
-    completed_runs = [r for r in completed_runs if not r.is_hub and r.end_ts is not None]
-    completed_runs_total_seconds = sum(r.duration_seconds or 0 for r in completed_runs)
+    # Get total duration of completed runs only (for live average calculation).
+    # Same filter as the count, so nothing to load before the first run completes.
+    completed_runs = repo.get_completed_non_hub_runs(limit=10000) if run_count else []
+
+    # One pass over completed runs for total duration and best single-run net
+    # profit (High Run detection), with values/costs loaded in batch
+    map_costs_enabled = settings.map_costs_enabled
+    completed_ids = [r.id for r in completed_runs]
+    run_values = repo.get_run_values_batch(completed_ids, tax_multiplier=settings.tax_multiplier)
+    run_costs = repo.get_run_costs_batch(completed_ids) if map_costs_enabled else {}
+
+    # Net value per run; costs are subtracted once up front rather than per iteration
+    run_nets = {run_id: value for run_id, (_, value) in run_values.items()}
+    if map_costs_enabled:
+        for run_id, (_, cost_value, _) in run_costs.items():
+            run_nets[run_id] -= cost_value
 
-    # Calculate best single-run net profit for High Run detection
-    map_costs_enabled = repo.get_setting("map_costs_enabled") == "true"
+    completed_runs_total_seconds = 0.0
     best_run_net_value = 0.0
     for r in completed_runs:
-        _, run_value = repo.get_run_value(r.id)
-        run_cost = 0.0
-        if map_costs_enabled:
-            _, cost_value, _ = repo.get_run_cost(r.id)
-            run_cost = cost_value
-        run_net = run_value - run_cost
+        completed_runs_total_seconds += r.duration_seconds or 0
+        run_net = run_nets[r.id]
         if run_net > best_run_net_value:
             best_run_net_value = run_net
 
     # Get cumulative loot value (with tax applied)
-    cumulative_loot = repo.get_cumulative_loot()
-    tax_multiplier = repo.get_trade_tax_multiplier()
-    total_gross_value = 0.0
-    for loot in cumulative_loot:
-        config_id = loot["config_base_id"]
-        quantity = loot["total_quantity"]
-        if config_id == FE_CONFIG_BASE_ID:
-            total_gross_value += float(quantity)
-        else:
-            price_fe = repo.get_effective_price(config_id)
-            if price_fe and price_fe > 0:
-                total_gross_value += price_fe * quantity * tax_multiplier
+    total_gross_value = repo.get_total_gross_value_fe(settings.tax_multiplier)
 
     # Get total map costs
     total_entry_cost = repo.get_total_map_costs()
@@ -456,8 +513,13 @@ def get_performance_stats(
 def get_active_run(
     request: Request,
     repo: Repository = Depends(get_repository),
-) -> Optional[ActiveRunResponse]:
-    """Get the currently active run with live loot drops."""
+    settings: RequestSettings = Depends(get_request_settings),
+) -> Optional[Response]:
+    """Get the currently active run with live loot drops.
+
+    Polled by the UI and overlay; the model is written straight to JSON by
+    pydantic-core.
+    """
     from datetime import datetime
 
     active_run = repo.get_active_run()
@@ -469,25 +531,32 @@ def get_active_run(
     if active_run.is_hub:
         return None
 
-    # Check if map costs are enabled
-    map_costs_enabled = repo.get_setting("map_costs_enabled") == "true"
+    map_costs_enabled = settings.map_costs_enabled
 
-    # Get loot for this run
+    # Get loot for this run; valued from the same summary with bulk price lookups
+    # (polled every second while a map is running)
     summary = repo.get_run_summary(active_run.id)
-    fe_gained, total_value = repo.get_run_value(active_run.id)
+    fe_gained, total_value = repo.get_run_values_batch(
+        [active_run.id],
+        summaries={active_run.id: summary},
+        tax_multiplier=settings.tax_multiplier,
+    )[active_run.id]
 
     # Get costs if enabled
     cost_items = None
     cost_fe = None
     net_value = None
     has_unpriced_costs = False
+    cost_summary: dict[int, int] = {}
     if map_costs_enabled:
         cost_summary, cost_value, unpriced = repo.get_run_cost(active_run.id)
-        if cost_summary:
-            cost_items = _build_cost_items(cost_summary, repo)
-            cost_fe = round(cost_value, 2)
-            net_value = round(total_value - cost_value, 2)
-            has_unpriced_costs = bool(unpriced)
+
+    items_map, prices_map = _lookup_maps(repo, summary, cost_summary)
+    if cost_summary:
+        cost_items = _build_cost_items(cost_summary, repo, items_map, prices_map)
+        cost_fe = round(cost_value, 2)
+        net_value = round(total_value - cost_value, 2)
+        has_unpriced_costs = bool(unpriced)
 
     # Use TimeTracker's actual play time (excludes paused time) if available,
     # otherwise fall back to wall clock duration
@@ -498,21 +567,23 @@ def get_active_run(
         now = datetime.now()
         duration = (now - active_run.start_ts).total_seconds()
 
-    zone_name = get_zone_display_name(active_run.zone_signature, active_run.level_id)
-
-    return ActiveRunResponse(
-        id=active_run.id,
-        zone_name=zone_name,
-        zone_signature=active_run.zone_signature,
-        start_ts=active_run.start_ts,
-        duration_seconds=round(duration, 1),
-        fe_gained=fe_gained,
-        total_value=round(total_value, 2),
-        loot=_build_loot(summary, repo),
-        map_cost_items=cost_items,
-        map_cost_fe=cost_fe,
-        map_cost_has_unpriced=has_unpriced_costs,
-        net_value_fe=net_value,
+    zone_name = _zone_name(active_run.zone_signature, active_run.level_id)
+
+    return model_json_response(
+        ActiveRunResponse.model_construct(
+            id=active_run.id,
+            zone_name=zone_name,
+            zone_signature=active_run.zone_signature,
+            start_ts=active_run.start_ts,
+            duration_seconds=round(duration, 1),
+            fe_gained=fe_gained,
+            total_value=round(total_value, 2),
+            loot=_build_loot(summary, repo, items_map, prices_map),
+            map_cost_items=cost_items,
+            map_cost_fe=cost_fe,
+            map_cost_has_unpriced=has_unpriced_costs,
+            net_value_fe=net_value,
+        )
     )
 
 
@@ -542,65 +613,84 @@ def reset_stats(
     )
 
 
-@router.get("/report", response_model=LootReportResponse)
-def get_loot_report(
-    repo: Repository = Depends(get_repository),
-) -> LootReportResponse:
-    """Get cumulative loot statistics across all runs since last reset."""
+@dataclass(slots=True)
+class LootReportData:
+    """Loot report as plain values, shared by the JSON and CSV endpoints."""
+
+    items: list[dict]  # LootReportItem fields, sorted by total value
+    total_value_fe: float
+    total_map_cost_fe: float
+    profit_fe: float
+    total_items: int
+    run_count: int
+    total_duration_seconds: float
+    profit_per_hour: float
+    profit_per_map: float
+    map_costs_enabled: bool
+
+
+def _compute_loot_report(repo: Repository, settings: RequestSettings) -> LootReportData:
+    """Compute cumulative loot statistics across all runs since last reset."""
     # Get aggregated loot data
     cumulative_loot = repo.get_cumulative_loot()
 
-    # Check if map costs are enabled
-    map_costs_enabled = repo.get_setting("map_costs_enabled") == "true"
+    map_costs_enabled = settings.map_costs_enabled
+    tax_multiplier = settings.tax_multiplier
 
-    # Get trade tax multiplier
-    tax_multiplier = repo.get_trade_tax_multiplier()
+    # Item metadata and effective prices for every looted item in two bulk lookups
+    config_ids = [loot["config_base_id"] for loot in cumulative_loot]
+    items_map = repo.get_items_bulk(config_ids)
+    prices_map = repo.get_effective_prices_bulk(config_ids)
 
     # Build report items with pricing
-    items: list[LootReportItem] = []
-    total_value = 0.0
+    items: list[dict] = []
+    sort_keys: list[tuple[bool, float]] = []
+    item_totals: list[float] = []
 
     for loot in cumulative_loot:
         config_id = loot["config_base_id"]
         quantity = loot["total_quantity"]
-
-        # Get item metadata
-        item = repo.get_item(config_id)
+        item = items_map.get(config_id)
 
         # Get price (FE is worth 1:1)
         if config_id == FE_CONFIG_BASE_ID:
             price_fe = 1.0
             item_total = float(quantity)  # FE is not taxed
         else:
-            price_fe = repo.get_effective_price(config_id)
+            price_fe = prices_map[config_id]
             if price_fe and price_fe > 0:
                 item_total = price_fe * quantity * tax_multiplier
             else:
                 item_total = None
 
         if item_total:
-            total_value += item_total
+            item_totals.append(item_total)
 
+        total_value_fe = round(item_total, 2) if item_total else None
         items.append(
-            LootReportItem(
-                config_base_id=config_id,
-                name=repo.get_item_name(config_id),
-                quantity=quantity,
-                icon_url=item.icon_url if item else None,
-                price_fe=price_fe,
-                total_value_fe=round(item_total, 2) if item_total else None,
-                percentage=None,  # Will be calculated after total is known
-            )
+            {
+                "config_base_id": config_id,
+                "name": repo.resolve_item_name(config_id, item.name_en if item else None),
+                "quantity": quantity,
+                "icon_url": item.icon_url if item else None,
+                "price_fe": price_fe,
+                "total_value_fe": total_value_fe,
+                "percentage": None,  # Will be calculated after total is known
+            }
         )
+        # Sort key: by total value (highest first), unpriced items at the end
+        sort_keys.append((total_value_fe is None, -(total_value_fe or 0)))
 
-    # Calculate percentages now that we have total_value
+    # Calculate percentages now that we have total_value (summed by the builtin)
+    total_value = sum(item_totals, 0.0)
     if total_value > 0:
         for item in items:
-            if item.total_value_fe is not None:
-                item.percentage = round((item.total_value_fe / total_value) * 100, 2)
+            if item["total_value_fe"] is not None:
+                item["percentage"] = round((item["total_value_fe"] / total_value) * 100, 2)
 
-    # Sort by total value (highest first), unpriced items at the end
-    items.sort(key=lambda x: (x.total_value_fe is None, -(x.total_value_fe or 0)))
+    # Decorate-sort-undecorate on the keys built above
+    decorated = sorted(zip(sort_keys, items), key=itemgetter(0))
+    items = [item for _, item in decorated]
 
     # Get run stats
     run_count = repo.get_completed_run_count()
@@ -616,7 +706,7 @@ def get_loot_report(
     profit_per_hour = (profit / total_duration * 3600) if total_duration > 0 else 0.0
     profit_per_map = profit / run_count if run_count > 0 else 0.0
 
-    return LootReportResponse(
+    return LootReportData(
         items=items,
         total_value_fe=round(total_value, 2),
         total_map_cost_fe=round(total_map_cost, 2),
@@ -630,45 +720,74 @@ def get_loot_report(
     )
 
 
-@router.get("/report/csv")
-def export_loot_report_csv(
+@router.get("/report", response_model=LootReportResponse)
+def get_loot_report(
     repo: Repository = Depends(get_repository),
+    settings: RequestSettings = Depends(get_request_settings),
 ) -> Response:
-    """Export loot report as CSV file."""
-    # Get the report data (reuse the same logic)
-    report = get_loot_report(repo)
+    """Get cumulative loot statistics across all runs since last reset."""
+    report = _compute_loot_report(repo, settings)
+    # Every value is computed from DB rows, so the model is built without validation.
+    # Item rows are already LootReportItem-shaped dicts.
+    values = {field.name: getattr(report, field.name) for field in dataclass_fields(report)}
+    return model_json_response(LootReportResponse.model_construct(**values))
 
-    # Build CSV content
-    lines = []
-    lines.append("Item Name,Config ID,Quantity,Unit Price (FE),Total Value (FE),Percentage")
 
+def _fmt(value: Optional[float], spec: str = ".2f") -> str:
+    """Format an optional number for CSV ('' when missing)."""
+    return format(value, spec) if value is not None else ""
+
+
+def _iter_loot_report_csv(report: LootReportData) -> Iterator[str]:
+    """Yield the loot report as CSV, one row at a time (csv module handles quoting)."""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+
+    def row(*fields) -> str:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerow(fields)
+        return buf.getvalue()
+
+    yield row(
+        "Item Name", "Config ID", "Quantity", "Unit Price (FE)", "Total Value (FE)", "Percentage"
+    )
     for item in report.items:
-        name = f'"{item.name.replace(chr(34), chr(34)+chr(34))}"'  # Escape quotes
-        config_id = item.config_base_id
-        quantity = item.quantity
-        unit_price = f"{item.price_fe:.2f}" if item.price_fe is not None else ""
-        total_value = f"{item.total_value_fe:.2f}" if item.total_value_fe is not None else ""
-        percentage = f"{item.percentage:.2f}" if item.percentage is not None else ""
-        lines.append(f"{name},{config_id},{quantity},{unit_price},{total_value},{percentage}")
+        yield row(
+            item["name"],
+            item["config_base_id"],
+            item["quantity"],
+            _fmt(item["price_fe"]),
+            _fmt(item["total_value_fe"]),
+            _fmt(item["percentage"]),
+        )
 
     # Summary section
-    lines.append("")
-    lines.append("Summary")
-    lines.append(f"Gross Value (FE),{report.total_value_fe:.2f}")
+    yield row()
+    yield row("Summary")
+    yield row("Gross Value (FE)", _fmt(report.total_value_fe))
     if report.map_costs_enabled:
-        lines.append(f"Map Costs (FE),{report.total_map_cost_fe:.2f}")
-    lines.append(f"Profit (FE),{report.profit_fe:.2f}")
-    lines.append(f"Runs,{report.run_count}")
-    lines.append(f"Total Time (seconds),{report.total_duration_seconds:.0f}")
-    lines.append(f"Profit/Hour (FE),{report.profit_per_hour:.2f}")
-    lines.append(f"Profit/Map (FE),{report.profit_per_map:.2f}")
-    lines.append(f"Unique Items,{report.total_items}")
-
-    csv_content = "\n".join(lines)
+        yield row("Map Costs (FE)", _fmt(report.total_map_cost_fe))
+    yield row("Profit (FE)", _fmt(report.profit_fe))
+    yield row("Runs", report.run_count)
+    yield row("Total Time (seconds)", _fmt(report.total_duration_seconds, ".0f"))
+    yield row("Profit/Hour (FE)", _fmt(report.profit_per_hour))
+    yield row("Profit/Map (FE)", _fmt(report.profit_per_map))
+    yield row("Unique Items", report.total_items)
+
+
+@router.get("/report/csv")
+def export_loot_report_csv(
+    repo: Repository = Depends(get_repository),
+    settings: RequestSettings = Depends(get_request_settings),
+) -> StreamingResponse:
+    """Export loot report as CSV file."""
+    # Same computation as the JSON report, written out without the response models
+    report = _compute_loot_report(repo, settings)
     filename = f"titrack-loot-report-{date.today().isoformat()}.csv"
 
-    return Response(
-        content=csv_content,
+    return StreamingResponse(
+        _iter_loot_report_csv(report),
         media_type="text/csv",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
@@ -680,50 +799,58 @@ def export_loot_report_csv(
 def get_run(
     run_id: int,
     repo: Repository = Depends(get_repository),
-) -> RunResponse:
+    settings: RequestSettings = Depends(get_request_settings),
+) -> Response:
     """Get a single run by ID."""
     run = repo.get_run(run_id)
     if not run:
         raise HTTPException(status_code=404, detail="Run not found")
 
-    # Check if map costs are enabled
-    map_costs_enabled = repo.get_setting("map_costs_enabled") == "true"
+    map_costs_enabled = settings.map_costs_enabled
 
     summary = repo.get_run_summary(run.id)
-    fe_gained, total_value = repo.get_run_value(run.id)
+    fe_gained, total_value = repo.get_run_values_batch(
+        [run.id], summaries={run.id: summary}, tax_multiplier=settings.tax_multiplier
+    )[run.id]
 
     # Get costs if enabled
     cost_items = None
     cost_fe = None
     net_value = None
     has_unpriced_costs = False
+    cost_summary: dict[int, int] = {}
     if map_costs_enabled:
         cost_summary, cost_value, unpriced = repo.get_run_cost(run.id)
-        if cost_summary:
-            cost_items = _build_cost_items(cost_summary, repo)
-            cost_fe = round(cost_value, 2)
-            net_value = round(total_value - cost_value, 2)
-            has_unpriced_costs = bool(unpriced)
+
+    items_map, prices_map = _lookup_maps(repo, summary, cost_summary)
+    if cost_summary:
+        cost_items = _build_cost_items(cost_summary, repo, items_map, prices_map)
+        cost_fe = round(cost_value, 2)
+        net_value = round(total_value - cost_value, 2)
+        has_unpriced_costs = bool(unpriced)
 
     is_nightmare = run.level_type == LEVEL_TYPE_NIGHTMARE
-    zone_name = get_zone_display_name(run.zone_signature, run.level_id)
     if is_nightmare:
-        zone_name += " (Nightmare)"
-
-    return RunResponse(
-        id=run.id,
-        zone_name=zone_name,
-        zone_signature=run.zone_signature,
-        start_ts=run.start_ts,
-        end_ts=run.end_ts,
-        duration_seconds=run.duration_seconds,
-        is_hub=run.is_hub,
-        is_nightmare=is_nightmare,
-        fe_gained=fe_gained,
-        total_value=round(total_value, 2),
-        loot=_build_loot(summary, repo),
-        map_cost_items=cost_items,
-        map_cost_fe=cost_fe,
-        map_cost_has_unpriced=has_unpriced_costs,
-        net_value_fe=net_value,
+        zone_name = _nightmare_zone_name(run.zone_signature, run.level_id)
+    else:
+        zone_name = _zone_name(run.zone_signature, run.level_id)
+
+    return model_json_response(
+        RunResponse.model_construct(
+            id=run.id,
+            zone_name=zone_name,
+            zone_signature=run.zone_signature,
+            start_ts=run.start_ts,
+            end_ts=run.end_ts,
+            duration_seconds=run.duration_seconds,
+            is_hub=run.is_hub,
+            is_nightmare=is_nightmare,
+            fe_gained=fe_gained,
+            total_value=round(total_value, 2),
+            loot=_build_loot(summary, repo, items_map, prices_map),
+            map_cost_items=cost_items,
+            map_cost_fe=cost_fe,
+            map_cost_has_unpriced=has_unpriced_costs,
+            net_value_fe=net_value,
+        )
     )
@@ -1,9 +1,15 @@
 """Settings API routes."""
 
-from fastapi import APIRouter, Depends, HTTPException
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel
 
 from titrack.api.dependencies import get_repository
+from titrack.api.responses import ORJSONResponse
 from titrack.config.settings import validate_game_directory
 from titrack.config.preferences import update_preference
 from titrack.db.repository import Repository
@@ -34,6 +40,31 @@ READONLY_SETTINGS = {
 }
 
 
+def _is_true(value: str) -> bool:
+    return value == "true"
+
+
+def _threshold(value: str) -> float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return 100.0
+
+
+# Settings mirrored to the preferences file, with the value type each one is stored as
+PREFERENCE_COERCERS: dict[str, Callable[[str], Any]] = {
+    "trade_tax_enabled": _is_true,
+    "map_costs_enabled": _is_true,
+    "cloud_sync_enabled": _is_true,
+    "cloud_auto_refresh": _is_true,
+    "cloud_midnight_refresh": _is_true,
+    "cloud_exchange_override": _is_true,
+    "cloud_startup_refresh": _is_true,
+    "log_directory": str,
+    "high_run_threshold": _threshold,
+}
+
+
 class SettingResponse(BaseModel):
     """Response for a single setting."""
 
@@ -51,7 +82,7 @@ class SettingUpdateRequest(BaseModel):
 def get_setting(
     key: str,
     repo: Repository = Depends(get_repository),
-) -> SettingResponse:
+) -> Response:
     """
     Get a setting value.
 
@@ -60,8 +91,8 @@ def get_setting(
     if key not in ALLOWED_SETTINGS and key not in READONLY_SETTINGS:
         raise HTTPException(status_code=403, detail="Setting not accessible")
 
-    value = repo.get_setting(key)
-    return SettingResponse(key=key, value=value)
+    # Shape matches SettingResponse; skip model construction and re-validation
+    return ORJSONResponse({"key": key, "value": repo.get_setting(key)})
 
 
 @router.put("/{key}", response_model=SettingResponse)
@@ -69,7 +100,7 @@ def update_setting(
     key: str,
     request: SettingUpdateRequest,
     repo: Repository = Depends(get_repository),
-) -> SettingResponse:
+) -> Response:
     """
     Update a setting value.
 
@@ -81,29 +112,11 @@ def update_setting(
     repo.set_setting(key, request.value)
     
     # Also save to preferences file for persistence across restarts
-    if key == "trade_tax_enabled":
-        update_preference("trade_tax_enabled", request.value == "true")
-    elif key == "map_costs_enabled":
-        update_preference("map_costs_enabled", request.value == "true")
-    elif key == "cloud_sync_enabled":
-        update_preference("cloud_sync_enabled", request.value == "true")
-    elif key == "cloud_auto_refresh":
-        update_preference("cloud_auto_refresh", request.value == "true")
-    elif key == "cloud_midnight_refresh":
-        update_preference("cloud_midnight_refresh", request.value == "true")
-    elif key == "cloud_exchange_override":
-        update_preference("cloud_exchange_override", request.value == "true")
-    elif key == "cloud_startup_refresh":
-        update_preference("cloud_startup_refresh", request.value == "true")
-    elif key == "log_directory":
-        update_preference("log_directory", request.value)
-    elif key == "high_run_threshold":
-        try:
-            update_preference("high_run_threshold", float(request.value))
-        except (ValueError, TypeError):
-            update_preference("high_run_threshold", 100.0)
-    
-    return SettingResponse(key=key, value=request.value)
+    coerce = PREFERENCE_COERCERS.get(key)
+    if coerce is not None:
+        update_preference(key, coerce(request.value))
+
+    return ORJSONResponse({"key": key, "value": request.value})
 
 
 class LogDirectoryValidateRequest(BaseModel):
@@ -120,6 +133,34 @@ class LogDirectoryValidateResponse(BaseModel):
     error: str | None
 
 
+# Recent validation results by input path. Directory pickers re-send the same path
+# while the user types; entries expire quickly so newly installed logs are found.
+_VALIDATION_TTL_SECONDS = 5.0
+_VALIDATION_CACHE_SIZE = 256
+_validation_cache: OrderedDict[str, tuple[float, bool, str | None]] = OrderedDict()
+_validation_lock = threading.Lock()
+
+
+def _validate_game_directory_cached(path: str) -> tuple[bool, str | None]:
+    """validate_game_directory with a short-lived LRU cache keyed on the raw path."""
+    now = time.monotonic()
+    with _validation_lock:
+        hit = _validation_cache.get(path)
+        if hit is not None and now - hit[0] < _VALIDATION_TTL_SECONDS:
+            _validation_cache.move_to_end(path)
+            return hit[1], hit[2]
+
+    is_valid, log_path = validate_game_directory(path)
+    result = (is_valid, str(log_path) if log_path else None)
+
+    with _validation_lock:
+        _validation_cache[path] = (now, *result)
+        _validation_cache.move_to_end(path)
+        if len(_validation_cache) > _VALIDATION_CACHE_SIZE:
+            _validation_cache.popitem(last=False)
+    return result
+
+
 @router.post("/log-directory/validate", response_model=LogDirectoryValidateResponse)
 def validate_log_directory(
     request: LogDirectoryValidateRequest,
@@ -129,12 +170,12 @@ def validate_log_directory(
 
     Returns whether the path is valid and the full log file path if found.
     """
-    is_valid, log_path = validate_game_directory(request.path)
+    is_valid, log_path = _validate_game_directory_cached(request.path)
 
     if is_valid:
         return LogDirectoryValidateResponse(
             valid=True,
-            log_path=str(log_path),
+            log_path=log_path,
             error=None,
         )
     else:
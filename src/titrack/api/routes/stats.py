@@ -1,18 +1,28 @@
 """Stats API routes for time-series data."""
 
+import re
+import threading
+from bisect import bisect_left
+from collections import deque
 from datetime import datetime, timedelta
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from pydantic import BaseModel
 
 from titrack.api.dependencies import get_repository
+from titrack.api.responses import ORJSONResponse
+from titrack.core.models import Run
 from titrack.data.zones import get_zone_display_name
 from titrack.db.repository import Repository
 from titrack.parser.patterns import FE_CONFIG_BASE_ID
 
 router = APIRouter(prefix="/api/stats", tags=["stats"])
 
+# CJK Unified Ideographs: zone names still showing Chinese need a translation
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+
 
 class TimeSeriesPoint(BaseModel):
     """Single point in time series."""
@@ -29,95 +39,155 @@ class TimeSeriesResponse(BaseModel):
     cumulative_fe: list[TimeSeriesPoint]  # Raw FE over time (legacy)
 
 
-@router.get("/history", response_model=TimeSeriesResponse)
-def get_stats_history(
-    hours: int = Query(24, ge=1, le=168, description="Hours of history to return"),
-    repo: Repository = Depends(get_repository),
-) -> TimeSeriesResponse:
+class _HistorySeries:
     """
-    Get time-series stats for charting.
+    Cumulative and rolling value/hour series over completed runs (oldest first).
 
-    Returns cumulative value and rolling value/hour over time.
-    Values include FE + priced items.
+    Completed runs don't change, so the series is kept between requests and
+    extended with newly completed runs instead of being rebuilt. `key` holds
+    everything else the values depend on (player context, tax, prices).
     """
-    # Get all non-hub runs
-    all_runs = repo.get_recent_runs(limit=10000)
-    runs = [r for r in all_runs if not r.is_hub and r.end_ts is not None]
-    runs.sort(key=lambda r: r.start_ts)  # Oldest first
-
-    if not runs:
-        return TimeSeriesResponse(
-            cumulative_value=[],
-            value_per_hour=[],
-            cumulative_fe=[],
-        )
 
-    # Calculate cumulative value at each run completion
-    cumulative_value_points = []
-    cumulative_fe_points = []
-    cumulative_value = 0.0
-    cumulative_fe = 0
-
-    # Pre-calculate run values for efficiency
-    run_values = {}
-    for run in runs:
-        fe_gained, total_value = repo.get_run_value(run.id)
-        run_values[run.id] = (fe_gained, total_value)
-
-    for run in runs:
-        fe_gained, total_value = run_values[run.id]
-        cumulative_fe += fe_gained
-        cumulative_value += total_value
-        cumulative_value_points.append(
-            TimeSeriesPoint(timestamp=run.end_ts, value=round(cumulative_value, 2))
-        )
-        cumulative_fe_points.append(
-            TimeSeriesPoint(timestamp=run.end_ts, value=cumulative_fe)
+    WINDOW = timedelta(minutes=60)
+
+    def __init__(self, key: tuple) -> None:
+        self.key = key
+        self.run_count = 0
+        self.last_run_id = 0
+        self.last_start_ts: Optional[datetime] = None
+        self.last_end_ts: Optional[datetime] = None
+        self.cumulative_value = 0.0
+        self.cumulative_fe = 0
+        # (end_ts, value, duration) of runs inside the current rolling window
+        self.window: deque[tuple[datetime, float, float]] = deque()
+        self.window_value = 0.0
+        self.window_duration = 0.0
+        # Points are TimeSeriesPoint-shaped dicts, encoded by orjson as-is
+        self.cumulative_value_points: list[dict] = []
+        self.cumulative_fe_points: list[dict] = []
+        self.value_per_hour_points: list[dict] = []
+        # End time of every point (shared by the three series), ascending
+        self.timestamps: list[datetime] = []
+
+    def can_append(self, runs: list[Run]) -> bool:
+        """True if runs (oldest first) all start and end after the last included run."""
+        if not runs or self.last_start_ts is None:
+            return True
+        return runs[0].start_ts >= self.last_start_ts and all(
+            r.end_ts >= self.last_end_ts for r in runs
         )
 
-    # Calculate rolling value/hour (using 1-hour windows)
-    value_per_hour_points = []
-    window_minutes = 60
-
-    for i, run in enumerate(runs):
-        # Find runs in the last hour window
-        window_start = run.end_ts - timedelta(minutes=window_minutes)
-        window_runs = [
-            r for r in runs[:i+1]
-            if r.end_ts and r.end_ts >= window_start
-        ]
-
-        if window_runs:
-            # Sum value in window
-            window_value = 0.0
-            window_duration = 0.0
-            for wr in window_runs:
-                _, total_value = run_values[wr.id]
-                window_value += total_value
-                if wr.duration_seconds:
-                    window_duration += wr.duration_seconds
+    def extend(self, runs: list[Run], run_values: dict[int, tuple[int, float]]) -> None:
+        """Append completed runs (oldest first) to every series."""
+        for run in runs:
+            fe_gained, run_value = run_values[run.id]
+            run_duration = run.duration_seconds or 0
+
+            # Cumulative value at each run completion
+            self.cumulative_fe += fe_gained
+            self.cumulative_value += run_value
+            self.cumulative_value_points.append(
+                {"timestamp": run.end_ts, "value": round(self.cumulative_value, 2)}
+            )
+            self.cumulative_fe_points.append(
+                {"timestamp": run.end_ts, "value": float(self.cumulative_fe)}
+            )
+
+            # Rolling value/hour (1-hour window). Runs don't overlap, so end times
+            # ascend with start times: drop runs from the window's left edge and
+            # keep running sums instead of rescanning every earlier run.
+            self.window.append((run.end_ts, run_value, run_duration))
+            self.window_value += run_value
+            self.window_duration += run_duration
+
+            window_start = run.end_ts - self.WINDOW
+            while self.window[0][0] < window_start:
+                _, old_value, old_duration = self.window.popleft()
+                self.window_value -= old_value
+                self.window_duration -= old_duration
+            if len(self.window) == 1:
+                # Only this run is left in the window: drop accumulated float drift
+                self.window_value = run_value
+                self.window_duration = run_duration
 
             # Calculate rate (value per hour)
-            if window_duration > 0:
-                value_rate = (window_value / window_duration) * 3600
+            if self.window_duration > 0:
+                value_rate = (self.window_value / self.window_duration) * 3600
             else:
-                value_rate = 0
+                value_rate = 0.0
 
-            value_per_hour_points.append(
-                TimeSeriesPoint(timestamp=run.end_ts, value=round(value_rate, 2))
+            self.value_per_hour_points.append(
+                {"timestamp": run.end_ts, "value": round(value_rate, 2)}
             )
+            self.timestamps.append(run.end_ts)
 
-    # Filter to requested time window
-    cutoff = datetime.now() - timedelta(hours=hours)
+            self.run_count += 1
+            self.last_run_id = max(self.last_run_id, run.id)
+            self.last_start_ts = run.start_ts
+            self.last_end_ts = run.end_ts
 
-    filtered_cumulative_value = [p for p in cumulative_value_points if p.timestamp >= cutoff]
-    filtered_value_rate = [p for p in value_per_hour_points if p.timestamp >= cutoff]
-    filtered_cumulative_fe = [p for p in cumulative_fe_points if p.timestamp >= cutoff]
 
-    return TimeSeriesResponse(
-        cumulative_value=filtered_cumulative_value,
-        value_per_hour=filtered_value_rate,
-        cumulative_fe=filtered_cumulative_fe,
+# One cached series per app; handlers run in the threadpool, so updates are serialized
+_history_lock = threading.Lock()
+
+
+def _current_history(request: Request, repo: Repository) -> _HistorySeries:
+    """Return the cached history series, extended or rebuilt as the data requires."""
+    key = (
+        *repo.get_player_context(),
+        repo.get_trade_tax_multiplier(),
+        repo.get_prices_fingerprint(),
+    )
+    run_count = repo.get_completed_run_count()
+
+    with _history_lock:
+        series: Optional[_HistorySeries] = getattr(request.app.state, "stats_history", None)
+
+        if series is not None and series.key == key and series.run_count <= run_count:
+            # Only runs completed since the last request need valuing
+            new_runs = repo.get_completed_non_hub_runs(after_id=series.last_run_id)
+            new_runs.reverse()  # Oldest first
+            if series.run_count + len(new_runs) == run_count and series.can_append(new_runs):
+                series.extend(new_runs, repo.get_run_values_batch([r.id for r in new_runs]))
+                return series
+
+        # Runs were removed or re-valued (session saved, prices or settings changed)
+        # Hubs and in-progress runs are filtered in SQL; rows come newest first
+        runs = repo.get_completed_non_hub_runs(limit=10000)
+        runs.reverse()  # Oldest first
+
+        series = _HistorySeries(key)
+        series.extend(runs, repo.get_run_values_batch([run.id for run in runs]))
+        request.app.state.stats_history = series
+        return series
+
+
+@router.get("/history", response_model=TimeSeriesResponse)
+def get_stats_history(
+    request: Request,
+    hours: int = Query(24, ge=1, le=168, description="Hours of history to return"),
+    repo: Repository = Depends(get_repository),
+) -> Response:
+    """
+    Get time-series stats for charting.
+
+    Returns cumulative value and rolling value/hour over time.
+    Values include FE + priced items. Points are already TimeSeriesResponse-shaped,
+    so they go straight to orjson (native datetime encoding) without re-validation.
+    """
+    series = _current_history(request, repo)
+
+    # Filter to requested time window. Points ascend by end time, so the window
+    # is a tail slice starting at the first point at or after the cutoff.
+    cutoff = datetime.now() - timedelta(hours=hours)
+    start = bisect_left(series.timestamps, cutoff)
+
+    return ORJSONResponse(
+        {
+            "cumulative_value": series.cumulative_value_points[start:],
+            "value_per_hour": series.value_per_hour_points[start:],
+            "cumulative_fe": series.cumulative_fe_points[start:],
+        }
     )
 
 
@@ -150,7 +220,7 @@ def get_zones(
     for sig in zone_signatures:
         display = get_zone_display_name(sig)
         # Check if it's untranslated (contains underscore or Chinese chars)
-        needs_trans = "_" in display or any('\u4e00' <= c <= '\u9fff' for c in display)
+        needs_trans = "_" in display or _CJK_RE.search(display) is not None
         if needs_trans:
             untranslated += 1
         zones.append(ZoneInfo(
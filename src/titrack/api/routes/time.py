@@ -1,14 +1,20 @@
 """Time tracking API routes."""
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response
 from pydantic import BaseModel
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
+from titrack.api.dependencies import get_time_tracker
+from titrack.api.responses import ORJSONResponse
 from titrack.config.preferences import load_preferences, save_preferences
+from titrack.core.time_tracker import TimeTracker
 
 
 router = APIRouter(prefix="/api/time", tags=["time"])
 
+# Body for the control endpoints, returned as-is without response encoding
+_SUCCESS = {"success": True}
+
 
 class PauseSettingsModel(BaseModel):
     bag: bool = True
@@ -43,24 +49,28 @@ class AutoPauseRequest(BaseModel):
     enabled: bool
 
 
+# Shape matches TimeState; returned while no time tracker is running
+_IDLE_TIME_STATE = TimeState(
+    total_play_state="stopped",
+    total_play_seconds=0,
+    mapping_play_state="stopped",
+    mapping_play_seconds=0,
+    auto_pause_on_inventory=False,
+).model_dump()
+
+
 @router.get("", response_model=TimeState)
-def get_time_state(request: Request) -> TimeState:
-    """Get current time tracking state."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if not time_tracker:
-        return TimeState(
-            total_play_state="stopped",
-            total_play_seconds=0,
-            mapping_play_state="stopped",
-            mapping_play_seconds=0,
-            auto_pause_on_inventory=False,
-            surgery_count=0,
-            avg_surgery_time_seconds=0.0,
-            pause_settings=PauseSettingsModel(),
-            surgery_prep_start_ts=None,
-            surgery_total_seconds=0.0,
-            contract_setting=None,
-        )
+def get_time_state(
+    request: Request,
+    time_tracker: Optional[TimeTracker] = Depends(get_time_tracker),
+) -> Response:
+    """Get current time tracking state.
+
+    Polled about once a second; values come from the in-process time tracker, so
+    the TimeState-shaped dict is returned directly without model validation.
+    """
+    if time_tracker is None:
+        return ORJSONResponse(_IDLE_TIME_STATE)
     
     state = time_tracker.get_state()
     ps = state.pause_settings
@@ -72,34 +82,37 @@ def get_time_state(request: Request) -> TimeState:
     collector = getattr(request.app.state, "collector", None)
     contract_setting = collector.current_contract_setting if collector else None
 
-    return TimeState(
-        total_play_state=state.total_play_state.value,
-        total_play_seconds=state.total_play_seconds,
-        mapping_play_state=state.mapping_play_state.value,
-        mapping_play_seconds=state.mapping_play_seconds,
-        auto_pause_on_inventory=state.auto_pause_on_inventory,
-        surgery_count=state.surgery_count,
-        avg_surgery_time_seconds=state.avg_surgery_time_seconds,
-        pause_settings=PauseSettingsModel(
-            bag=ps.bag if ps else True,
-            pet=ps.pet if ps else True,
-            talent=ps.talent if ps else True,
-            settings=ps.settings if ps else True,
-            skill=ps.skill if ps else True,
-            auction=ps.auction if ps else True,
-        ),
-        surgery_prep_start_ts=surgery_prep_ts,
-        surgery_total_seconds=state.surgery_total_seconds,
-        current_map_play_seconds=state.current_map_play_seconds,
-        contract_setting=contract_setting,
+    return ORJSONResponse(
+        {
+            "total_play_state": state.total_play_state.value,
+            "total_play_seconds": state.total_play_seconds,
+            "mapping_play_state": state.mapping_play_state.value,
+            "mapping_play_seconds": state.mapping_play_seconds,
+            "auto_pause_on_inventory": state.auto_pause_on_inventory,
+            "surgery_count": state.surgery_count,
+            "avg_surgery_time_seconds": state.avg_surgery_time_seconds,
+            "pause_settings": {
+                "bag": ps.bag if ps else True,
+                "pet": ps.pet if ps else True,
+                "talent": ps.talent if ps else True,
+                "settings": ps.settings if ps else True,
+                "skill": ps.skill if ps else True,
+                "auction": ps.auction if ps else True,
+            },
+            "surgery_prep_start_ts": surgery_prep_ts,
+            "surgery_total_seconds": state.surgery_total_seconds,
+            "current_map_play_seconds": state.current_map_play_seconds,
+            "contract_setting": contract_setting,
+        }
     )
 
 
 @router.post("/toggle", response_model=ToggleResponse)
-def toggle_play(request: Request) -> ToggleResponse:
+def toggle_play(
+    time_tracker: Optional[TimeTracker] = Depends(get_time_tracker),
+) -> ToggleResponse:
     """Toggle play/pause state for total play time."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if not time_tracker:
+    if time_tracker is None:
         return ToggleResponse(new_state="stopped", total_play_seconds=0)
     
     new_state = time_tracker.toggle_total_play()
@@ -109,56 +122,37 @@ def toggle_play(request: Request) -> ToggleResponse:
     )
 
 
-@router.post("/start")
-def start_play(request: Request) -> dict:
-    """Start total play time tracking."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if time_tracker:
-        time_tracker.start_total_play()
-    return {"success": True}
-
-
-@router.post("/stop")
-def stop_play(request: Request) -> dict:
-    """Stop total play time tracking."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if time_tracker:
-        time_tracker.stop_total_play()
-    return {"success": True}
-
-
-@router.post("/pause")
-def pause_play(request: Request) -> dict:
-    """Pause total play time tracking."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if time_tracker:
-        time_tracker.pause_total_play()
-    return {"success": True}
-
-
-@router.post("/resume")
-def resume_play(request: Request) -> dict:
-    """Resume total play time tracking."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if time_tracker:
-        time_tracker.resume_total_play()
-    return {"success": True}
-
-
 @router.post("/auto-pause", response_model=dict)
-def set_auto_pause(request: Request, body: AutoPauseRequest) -> dict:
+def set_auto_pause(
+    body: AutoPauseRequest,
+    time_tracker: Optional[TimeTracker] = Depends(get_time_tracker),
+) -> dict:
     """Enable/disable auto-pause on inventory open."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if time_tracker:
+    if time_tracker is not None:
         time_tracker.set_auto_pause_on_inventory(body.enabled)
     return {"success": True, "auto_pause_on_inventory": body.enabled}
 
 
+def _persist_pause_settings(body: PauseSettingsModel) -> None:
+    """Save pause settings to the preferences file for persistence across restarts."""
+    prefs = load_preferences()
+    prefs.pause_bag = body.bag
+    prefs.pause_pet = body.pet
+    prefs.pause_talent = body.talent
+    prefs.pause_settings = body.settings
+    prefs.pause_skill = body.skill
+    prefs.pause_auction = body.auction
+    save_preferences(prefs)
+
+
 @router.post("/pause-settings", response_model=dict)
-def set_pause_settings(request: Request, body: PauseSettingsModel) -> dict:
+def set_pause_settings(
+    body: PauseSettingsModel,
+    background_tasks: BackgroundTasks,
+    time_tracker: Optional[TimeTracker] = Depends(get_time_tracker),
+) -> dict:
     """Update which views trigger auto-pause."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if time_tracker:
+    if time_tracker is not None:
         time_tracker.set_pause_settings(
             bag=body.bag,
             pet=body.pet,
@@ -167,45 +161,42 @@ def set_pause_settings(request: Request, body: PauseSettingsModel) -> dict:
             skill=body.skill,
             auction=body.auction,
         )
-    
-    # Save to preferences file for persistence across restarts
-    prefs = load_preferences()
-    prefs.pause_bag = body.bag
-    prefs.pause_pet = body.pet
-    prefs.pause_talent = body.talent
-    prefs.pause_settings = body.settings
-    prefs.pause_skill = body.skill
-    prefs.pause_auction = body.auction
-    save_preferences(prefs)
-    
+
+    # The tracker applies the change immediately; the preferences file is written
+    # after the response is sent
+    background_tasks.add_task(_persist_pause_settings, body)
+
     return {
         "success": True,
-        "pause_settings": body.dict(),
+        "pause_settings": body.model_dump(),
     }
 
 
-@router.post("/reset/mapping")
-def reset_mapping_time(request: Request) -> dict:
-    """Reset mapping time counter."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if time_tracker:
-        time_tracker.reset_mapping_time()
-    return {"success": True}
+# Control endpoints that take no input and only call one TimeTracker method.
+# They are plain Starlette routes, each bound to its method name, so a hotkey
+# press skips FastAPI's dependency solving and response-model handling.
+_TIME_ACTIONS = {
+    "/start": "start_total_play",
+    "/stop": "stop_total_play",
+    "/pause": "pause_total_play",
+    "/resume": "resume_total_play",
+    "/reset/mapping": "reset_mapping_time",
+    "/reset/total": "reset_total_time",
+    "/reset/all": "reset_all",
+}
+
+
+def _time_action(method_name: str) -> Callable[[Request], Awaitable[Response]]:
+    """Build the endpoint that runs one TimeTracker method."""
 
+    async def endpoint(request: Request) -> Response:
+        time_tracker = get_time_tracker(request)
+        if time_tracker is not None:
+            getattr(time_tracker, method_name)()
+        return ORJSONResponse(_SUCCESS)
 
-@router.post("/reset/total")
-def reset_total_time(request: Request) -> dict:
-    """Reset total play time counter."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if time_tracker:
-        time_tracker.reset_total_time()
-    return {"success": True}
+    return endpoint
 
 
-@router.post("/reset/all")
-def reset_all_time(request: Request) -> dict:
-    """Reset all time counters."""
-    time_tracker = getattr(request.app.state, "time_tracker", None)
-    if time_tracker:
-        time_tracker.reset_all()
-    return {"success": True}
+for _path, _method_name in _TIME_ACTIONS.items():
+    router.add_route(router.prefix + _path, _time_action(_method_name), methods=["POST"])
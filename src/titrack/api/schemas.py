@@ -1,26 +1,39 @@
 """Pydantic schemas for API responses."""
 
 from datetime import datetime
-from typing import Optional
+from typing import NotRequired, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, StrictInt
+from typing_extensions import TypedDict  # pydantic needs this TypedDict on Python < 3.12
 
 
+# Base for InventoryItem, which adds price_source
 class LootItem(BaseModel):
     """Single item in loot breakdown."""
 
-    config_base_id: int
+    config_base_id: StrictInt
     name: str
-    quantity: int
+    quantity: StrictInt
     icon_url: Optional[str] = None
     price_fe: Optional[float] = None  # Price per unit
     total_value_fe: Optional[float] = None  # quantity * price
 
 
+class LootItemDict(TypedDict):
+    """Loot or cost row on run responses (same fields as LootItem, built as plain dicts)."""
+
+    config_base_id: StrictInt
+    name: str
+    quantity: StrictInt
+    icon_url: NotRequired[Optional[str]]
+    price_fe: NotRequired[Optional[float]]  # Price per unit
+    total_value_fe: NotRequired[Optional[float]]  # quantity * price
+
+
 class RunResponse(BaseModel):
     """Single run response."""
 
-    id: int
+    id: StrictInt
     zone_name: str
     zone_signature: str
     start_ts: datetime
@@ -28,12 +41,12 @@ class RunResponse(BaseModel):
     duration_seconds: Optional[float] = None
     is_hub: bool
     is_nightmare: bool = False  # True if this is a nightmare run (Twinightmare)
-    fe_gained: int  # Raw FE currency gained
+    fe_gained: StrictInt  # Raw FE currency gained
     total_value: float  # Total value including priced items (gross)
-    loot: list[LootItem]
-    consolidated_run_ids: Optional[list[int]] = None  # IDs of runs merged into this one
+    loot: list[LootItemDict]
+    consolidated_run_ids: Optional[list[StrictInt]] = None  # IDs of runs merged into this one
     # Map cost tracking fields (only populated when map_costs_enabled)
-    map_cost_items: Optional[list[LootItem]] = None  # Items consumed (each item has price_fe=None if unknown)
+    map_cost_items: Optional[list[LootItemDict]] = None  # Items consumed (each item has price_fe=None if unknown)
     map_cost_fe: Optional[float] = None  # Sum of priced items only
     map_cost_has_unpriced: bool = False  # True if any items have unknown price
     net_value_fe: Optional[float] = None  # total_value - map_cost_fe
@@ -43,24 +56,24 @@ class RunListResponse(BaseModel):
     """Paginated list of runs."""
 
     runs: list[RunResponse]
-    total: int
-    page: int
-    page_size: int
+    total: StrictInt
+    page: StrictInt
+    page_size: StrictInt
 
 
 class ActiveRunResponse(BaseModel):
     """Currently active run with live loot drops."""
 
-    id: int
+    id: StrictInt
     zone_name: str
     zone_signature: str
     start_ts: datetime
     duration_seconds: float  # Time since run started
-    fe_gained: int  # Raw FE currency gained so far
+    fe_gained: StrictInt  # Raw FE currency gained so far
     total_value: float  # Total value including priced items (gross)
-    loot: list[LootItem]  # Items picked up so far
+    loot: list[LootItemDict]  # Items picked up so far
     # Map cost tracking fields (only populated when map_costs_enabled)
-    map_cost_items: Optional[list[LootItem]] = None  # Items consumed (each item has price_fe=None if unknown)
+    map_cost_items: Optional[list[LootItemDict]] = None  # Items consumed (each item has price_fe=None if unknown)
     map_cost_fe: Optional[float] = None  # Sum of priced items only
     map_cost_has_unpriced: bool = False  # True if any items have unknown price
     net_value_fe: Optional[float] = None  # total_value - map_cost_fe
@@ -69,8 +82,8 @@ class ActiveRunResponse(BaseModel):
 class RunStatsResponse(BaseModel):
     """Summary statistics for runs."""
 
-    total_runs: int
-    total_fe: int  # Raw FE gained
+    total_runs: StrictInt
+    total_fe: StrictInt  # Raw FE gained
     total_value: float  # Total value including priced items
     avg_fe_per_run: float
     avg_value_per_run: float
@@ -79,15 +92,9 @@ class RunStatsResponse(BaseModel):
     value_per_hour: float  # Total value per hour
 
 
-class InventoryItem(BaseModel):
+class InventoryItem(LootItem):
     """Single item in inventory."""
 
-    config_base_id: int
-    name: str
-    quantity: int
-    icon_url: Optional[str] = None
-    price_fe: Optional[float] = None
-    total_value_fe: Optional[float] = None
     price_source: Optional[str] = None  # 'exchange', 'cloud', 'local', 'fallback'
 
 
@@ -95,14 +102,15 @@ class InventoryResponse(BaseModel):
     """Current inventory state."""
 
     items: list[InventoryItem]
-    total_fe: int
+    total_fe: StrictInt
     net_worth_fe: float
+    total: StrictInt = 0  # Distinct items before limit/offset
 
 
 class ItemResponse(BaseModel):
     """Item metadata response."""
 
-    config_base_id: int
+    config_base_id: StrictInt
     name_en: Optional[str] = None
     name_cn: Optional[str] = None
     type_cn: Optional[str] = None
@@ -115,7 +123,7 @@ class ItemListResponse(BaseModel):
     """List of items."""
 
     items: list[ItemResponse]
-    total: int
+    total: StrictInt
 
 
 class ItemUpdateRequest(BaseModel):
@@ -127,7 +135,7 @@ class ItemUpdateRequest(BaseModel):
 class PriceResponse(BaseModel):
     """Price entry response."""
 
-    config_base_id: int
+    config_base_id: StrictInt
     name: str
     price_fe: float
     source: str
@@ -138,7 +146,7 @@ class PriceListResponse(BaseModel):
     """List of prices."""
 
     prices: list[PriceResponse]
-    total: int
+    total: StrictInt
 
 
 class PriceUpdateRequest(BaseModel):
@@ -146,6 +154,19 @@ class PriceUpdateRequest(BaseModel):
 
     price_fe: float
     source: str = "manual"
+    updated_at: Optional[datetime] = None  # Defaults to now
+
+
+class PriceBulkUpdateEntry(PriceUpdateRequest):
+    """One entry of a bulk price update."""
+
+    config_base_id: int
+
+
+class PriceBulkUpdateResponse(BaseModel):
+    """Result of a bulk price update."""
+
+    updated: StrictInt
 
 
 class StatusResponse(BaseModel):
@@ -156,8 +177,8 @@ class StatusResponse(BaseModel):
     db_path: str
     log_path: Optional[str] = None
     log_path_missing: bool = False
-    item_count: int
-    run_count: int
+    item_count: StrictInt
+    run_count: StrictInt
     awaiting_player: bool = False
 
 
@@ -165,24 +186,18 @@ class PlayerResponse(BaseModel):
     """Player/character information."""
 
     name: str
-    level: int
-    season_id: int
+    level: StrictInt
+    season_id: StrictInt
     season_name: str
-    hero_id: int
+    hero_id: StrictInt
     hero_name: str
     player_id: Optional[str] = None
 
 
-class LootReportItem(BaseModel):
+class LootReportItem(LootItemDict):
     """Single item in loot report."""
 
-    config_base_id: int
-    name: str
-    quantity: int
-    icon_url: Optional[str] = None
-    price_fe: Optional[float] = None  # Price per unit
-    total_value_fe: Optional[float] = None  # quantity * price
-    percentage: Optional[float] = None  # Percentage of total value
+    percentage: NotRequired[Optional[float]]  # Percentage of total value
 
 
 class LootReportResponse(BaseModel):
@@ -192,8 +207,8 @@ class LootReportResponse(BaseModel):
     total_value_fe: float  # Gross value of all loot
     total_map_cost_fe: float  # Total map costs (if enabled)
     profit_fe: float  # total_value_fe - total_map_cost_fe
-    total_items: int  # Count of unique item types
-    run_count: int
+    total_items: StrictInt  # Count of unique item types
+    run_count: StrictInt
     total_duration_seconds: float  # Total time spent in maps
     profit_per_hour: float  # Profit per hour of map time
     profit_per_map: float  # Average profit per map
@@ -214,7 +229,7 @@ class PerformanceStatsResponse(BaseModel):
     profit_per_hour_mapping: float  # Net profit / mapping hours
 
     # Run statistics
-    run_count: int
+    run_count: StrictInt
     avg_run_seconds: float  # Average time per run (mapping time / run count)
     completed_runs_total_seconds: float = 0.0  # Total duration of completed runs only
 
@@ -1,20 +1,23 @@
 """CLI commands for testing and manual operation."""
 
 import argparse
-import json
 import signal
 import subprocess
 import sys
 import threading
 import webbrowser
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional
 
+from titrack.api.responses import loads
 from titrack.collector.collector import Collector
 from titrack.config.logging import setup_logging, get_logger
 from titrack.config.settings import Settings, find_log_file
-from titrack.core.models import ItemDelta, Price, Run
+from titrack.core.models import EventContext, ItemDelta, Price, Run
 from titrack.core.time_tracker import TimeTracker
 from titrack.data.zones import get_zone_display_name
 from titrack.db.connection import Database
@@ -24,11 +27,31 @@ from titrack.parser.player_parser import get_enter_log_path, get_effective_playe
 from titrack.sync.manager import SyncManager
 
 
+# Display names for printed deltas; items rarely change within a CLI session
+_item_names: dict[int, str] = {}
+
+
+def _item_name(repo: Repository, config_base_id: int) -> str:
+    """repo.get_item_name(), memoized for names read from the items table."""
+    name = _item_names.get(config_base_id)
+    if name is None:
+        name = repo.get_item_name(config_base_id)
+        # Korean and "unknown" names resolve without SQL; caching only DB names lets
+        # an item synced later in the session still show up under its real name
+        if name != repo.resolve_item_name(config_base_id, None):
+            _item_names[config_base_id] = name
+    return name
+
+
+# "[PICK_ITEMS]" etc., formatted once instead of per printed delta
+_CONTEXT_LABELS = {context: f"[{context.name}]" for context in EventContext}
+
+
 def _print_delta(delta: ItemDelta, repo: Repository) -> None:
     """Print a delta to console."""
-    item_name = repo.get_item_name(delta.config_base_id)
+    item_name = _item_name(repo, delta.config_base_id)
     sign = "+" if delta.delta > 0 else ""
-    context_str = f"[{delta.context.name}]" if delta.proto_name else ""
+    context_str = _CONTEXT_LABELS[delta.context] if delta.proto_name else ""
     print(f"  {sign}{delta.delta} {item_name} {context_str}")
 
 
@@ -59,11 +82,33 @@ def _print_run_end(run: Run, repo: Repository) -> None:
         # Show other items
         for config_id, total in sorted(summary.items()):
             if config_id != FE_CONFIG_BASE_ID and total != 0:
-                name = repo.get_item_name(config_id)
+                name = _item_name(repo, config_id)
                 sign = "+" if total > 0 else ""
                 print(f"  {sign}{total} {name}")
 
 
+@contextmanager
+def _open_repository(db_path: Path) -> Iterator[Repository]:
+    """Open the database for a one-shot command; closed even if the command fails."""
+    db = Database(db_path)
+    db.connect()
+    try:
+        yield Repository(db)
+    finally:
+        db.close()
+
+
+# Rows per upsert call when loading seed files
+SEED_BATCH_SIZE = 10_000
+
+
+def _upsert_in_batches(upsert: Callable[[list], None], rows: Iterable) -> None:
+    """Hand rows to a batch upsert SEED_BATCH_SIZE at a time."""
+    rows = iter(rows)
+    while batch := list(islice(rows, SEED_BATCH_SIZE)):
+        upsert(batch)
+
+
 def cmd_init(args: argparse.Namespace) -> int:
     """Initialize database and optionally seed items and prices."""
     settings = Settings.from_args(
@@ -74,82 +119,80 @@ def cmd_init(args: argparse.Namespace) -> int:
 
     print(f"Initializing database at: {settings.db_path}")
 
-    db = Database(settings.db_path)
-    db.connect()
-
-    repo = Repository(db)
-
-    # Seed items if provided
-    if settings.seed_file:
-        print(f"Seeding items from: {settings.seed_file}")
-        count = _seed_items(repo, settings.seed_file)
-        print(f"  Loaded {count} items")
-    else:
-        existing = repo.get_item_count()
-        print(f"  {existing} items in database")
-
-    # Seed prices if provided
-    prices_seed = getattr(args, 'prices_seed', None)
-    if prices_seed:
-        prices_path = Path(prices_seed)
-        if prices_path.exists():
-            print(f"Seeding prices from: {prices_path}")
-            count = _seed_prices(repo, prices_path)
-            print(f"  Loaded {count} prices")
+    with _open_repository(settings.db_path) as repo:
+        # Seed items if provided
+        if settings.seed_file:
+            print(f"Seeding items from: {settings.seed_file}")
+            count = _seed_items(repo, settings.seed_file)
+            print(f"  Loaded {count} items")
         else:
-            print(f"  Warning: Price seed file not found: {prices_path}")
-    else:
-        existing = repo.get_price_count()
-        print(f"  {existing} prices in database")
+            existing = repo.get_item_count()
+            print(f"  {existing} items in database")
+
+        # Seed prices if provided
+        prices_seed = getattr(args, 'prices_seed', None)
+        if prices_seed:
+            prices_path = Path(prices_seed)
+            if prices_path.exists():
+                print(f"Seeding prices from: {prices_path}")
+                count = _seed_prices(repo, prices_path)
+                print(f"  Loaded {count} prices")
+            else:
+                print(f"  Warning: Price seed file not found: {prices_path}")
+        else:
+            existing = repo.get_price_count()
+            print(f"  {existing} prices in database")
 
-    db.close()
     print("Done.")
     return 0
 
 
 def _seed_items(repo: Repository, seed_file: Path) -> int:
     """Load items from seed file into database."""
-    with open(seed_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(seed_file, "rb") as f:
+        data = loads(f.read())
 
     items_data = data.get("items", [])
-    items = []
-
-    for item_data in items_data:
-        item = Item(
-            config_base_id=int(item_data["id"]),
-            name_en=item_data.get("name_en"),
-            name_cn=item_data.get("name_cn"),
-            type_cn=item_data.get("type_cn"),
-            icon_url=item_data.get("img"),
-            url_en=item_data.get("url_en"),
-            url_cn=item_data.get("url_cn"),
+
+    # Rows go straight to the upsert as parameter tuples (no Item objects),
+    # built lazily and written in fixed-size batches
+    rows = (
+        (
+            int(item_data["id"]),
+            item_data.get("name_en"),
+            item_data.get("name_cn"),
+            item_data.get("type_cn"),
+            item_data.get("img"),
+            item_data.get("url_en"),
+            item_data.get("url_cn"),
         )
-        items.append(item)
+        for item_data in items_data
+    )
 
-    repo.upsert_items_batch(items)
-    return len(items)
+    _upsert_in_batches(repo.upsert_item_rows, rows)
+    return len(items_data)
 
 
 def _seed_prices(repo: Repository, seed_file: Path) -> int:
     """Load prices from seed file into database."""
-    with open(seed_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    with open(seed_file, "rb") as f:
+        data = loads(f.read())
 
     prices_data = data.get("prices", [])
-    prices = []
+    now = datetime.now()
 
-    for price_data in prices_data:
-        price = Price(
+    prices = (
+        Price(
             config_base_id=int(price_data["id"]),
             price_fe=float(price_data["price_fe"]),
             source=price_data.get("source", "seed"),
-            updated_at=datetime.now(),
+            updated_at=now,
         )
-        prices.append(price)
+        for price_data in prices_data
+    )
 
-    repo.upsert_prices_batch(prices)
-    return len(prices)
+    _upsert_in_batches(repo.upsert_prices_batch, prices)
+    return len(prices_data)
 
 
 def cmd_parse_file(args: argparse.Namespace) -> int:
@@ -178,27 +221,22 @@ def cmd_parse_file(args: argparse.Namespace) -> int:
     else:
         print("Warning: Could not detect player info")
 
-    db = Database(settings.db_path)
-    db.connect()
-
-    repo = Repository(db)
-    collector = Collector(
-        db=db,
-        log_path=settings.log_path,
-        on_delta=lambda d: _print_delta(d, repo),
-        on_run_start=_print_run_start,
-        on_run_end=lambda r: _print_run_end(r, repo),
-        player_info=player_info,
-    )
-    collector.initialize()
+    with _open_repository(settings.db_path) as repo:
+        collector = Collector(
+            db=repo.db,
+            log_path=settings.log_path,
+            on_delta=lambda d: _print_delta(d, repo),
+            on_run_start=_print_run_start,
+            on_run_end=lambda r: _print_run_end(r, repo),
+            player_info=player_info,
+        )
+        collector.initialize()
 
-    from_beginning = args.from_beginning if hasattr(args,
-                                                    "from_beginning") else True
-    line_count = collector.process_file(from_beginning=from_beginning)
+        from_beginning = args.from_beginning if hasattr(args,
+                                                        "from_beginning") else True
+        line_count = collector.process_file(from_beginning=from_beginning)
 
     print(f"\nProcessed {line_count} lines")
-
-    db.close()
     return 0
 
 
@@ -233,32 +271,28 @@ def cmd_tail(args: argparse.Namespace) -> int:
 
     print("Press Ctrl+C to stop\n")
 
-    db = Database(settings.db_path)
-    db.connect()
-
-    repo = Repository(db)
-    collector = Collector(
-        db=db,
-        log_path=settings.log_path,
-        on_delta=lambda d: _print_delta(d, repo),
-        on_run_start=_print_run_start,
-        on_run_end=lambda r: _print_run_end(r, repo),
-        player_info=player_info,
-    )
-    collector.initialize()
+    with _open_repository(settings.db_path) as repo:
+        collector = Collector(
+            db=repo.db,
+            log_path=settings.log_path,
+            on_delta=lambda d: _print_delta(d, repo),
+            on_run_start=_print_run_start,
+            on_run_end=lambda r: _print_run_end(r, repo),
+            player_info=player_info,
+        )
+        collector.initialize()
 
-    def signal_handler(sig, frame):
-        print("\nStopping...")
-        collector.stop()
+        def signal_handler(sig, frame):
+            print("\nStopping...")
+            collector.stop()
 
-    signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGINT, signal_handler)
 
-    try:
-        collector.tail(poll_interval=settings.poll_interval)
-    except KeyboardInterrupt:
-        pass
+        try:
+            collector.tail(poll_interval=settings.poll_interval)
+        except KeyboardInterrupt:
+            pass
 
-    db.close()
     return 0
 
 
@@ -269,37 +303,30 @@ def cmd_show_state(args: argparse.Namespace) -> int:
         portable=args.portable,
     )
 
-    db = Database(settings.db_path)
-    db.connect()
-
-    repo = Repository(db)
-    states = repo.get_all_slot_states()
+    with _open_repository(settings.db_path) as repo:
+        # Summed per item in SQL (same filtering as get_all_slot_states)
+        totals = repo.get_inventory_totals()
 
-    if not states:
-        print("No inventory state recorded")
-        db.close()
-        return 0
+        if not totals:
+            print("No inventory state recorded")
+            return 0
 
-    # Aggregate by item
-    totals: dict[int, int] = {}
-    for state in states:
-        if state.num > 0:
-            totals[state.config_base_id] = totals.get(state.config_base_id,
-                                                      0) + state.num
+        # Names for all listed items in one batched lookup instead of one query per line
+        items_map = repo.get_items_bulk(list(totals))
 
-    print("Current Inventory:")
-    print("-" * 40)
+        print("Current Inventory:")
+        print("-" * 40)
 
-    # Sort by quantity descending
-    for config_id, total in sorted(totals.items(), key=lambda x: -x[1]):
-        name = repo.get_item_name(config_id)
-        fe_marker = " (FE)" if config_id == FE_CONFIG_BASE_ID else ""
-        print(f"  {total:>8} {name}{fe_marker}")
+        # Sort by quantity descending
+        for config_id, total in sorted(totals.items(), key=itemgetter(1), reverse=True):
+            item = items_map.get(config_id)
+            name = repo.resolve_item_name(config_id, item.name_en if item else None)
+            fe_marker = " (FE)" if config_id == FE_CONFIG_BASE_ID else ""
+            print(f"  {total:>8} {name}{fe_marker}")
 
-    print("-" * 40)
-    print(f"Total item types: {len(totals)}")
+        print("-" * 40)
+        print(f"Total item types: {len(totals)}")
 
-    db.close()
     return 0
 
 
@@ -310,41 +337,38 @@ def cmd_show_runs(args: argparse.Namespace) -> int:
         portable=args.portable,
     )
 
-    db = Database(settings.db_path)
-    db.connect()
+    with _open_repository(settings.db_path) as repo:
+        runs = repo.get_recent_runs(limit=args.limit)
 
-    repo = Repository(db)
-    runs = repo.get_recent_runs(limit=args.limit)
+        if not runs:
+            print("No runs recorded")
+            return 0
 
-    if not runs:
-        print("No runs recorded")
-        db.close()
-        return 0
+        # One grouped query for all listed runs instead of one per line
+        summaries = repo.get_run_summaries_batch([run.id for run in runs])
 
-    print(f"Recent Runs (last {len(runs)}):")
-    print("-" * 60)
+        print(f"Recent Runs (last {len(runs)}):")
+        print("-" * 60)
 
-    for run in runs:
-        # Format duration
-        if run.duration_seconds:
-            minutes = int(run.duration_seconds // 60)
-            seconds = int(run.duration_seconds % 60)
-            duration_str = f"{minutes}m {seconds}s"
-        else:
-            duration_str = "active"
+        for run in runs:
+            # Format duration
+            if run.duration_seconds:
+                minutes = int(run.duration_seconds // 60)
+                seconds = int(run.duration_seconds % 60)
+                duration_str = f"{minutes}m {seconds}s"
+            else:
+                duration_str = "active"
 
-        # Get FE for run
-        summary = repo.get_run_summary(run.id)
-        fe_gained = summary.get(FE_CONFIG_BASE_ID, 0)
+            # Get FE for run
+            fe_gained = summaries.get(run.id, {}).get(FE_CONFIG_BASE_ID, 0)
 
-        hub_str = "[hub] " if run.is_hub else ""
-        zone_name = get_zone_display_name(run.zone_signature, run.level_id)
-        print(f"  #{run.id:3} {hub_str}{zone_name[:30]:<30} "
-              f"{duration_str:>10} FE: {fe_gained:+d}")
+            hub_str = "[hub] " if run.is_hub else ""
+            zone_name = get_zone_display_name(run.zone_signature, run.level_id)
+            print(f"  #{run.id:3} {hub_str}{zone_name[:30]:<30} "
+                  f"{duration_str:>10} FE: {fe_gained:+d}")
 
-    print("-" * 60)
+        print("-" * 60)
 
-    db.close()
     return 0
 
 
@@ -765,34 +789,40 @@ def _serve_with_window(args: argparse.Namespace, settings: Settings,
             port=port,
             log_level="warning",
         )
-        server = uvicorn.Server(config)
+        server_ready = threading.Event()
+
+        class ReadyServer(uvicorn.Server):
+            """uvicorn.Server that signals once its sockets are listening."""
+
+            async def startup(self, sockets=None):
+                await super().startup(sockets=sockets)
+                server_ready.set()
+
+        server = ReadyServer(config)
 
         def run_server():
             try:
                 server.run()
             except Exception as e:
                 logger.error(f"Server error: {e}")
+            finally:
+                server_ready.set()  # Never leave the window waiting on a dead server
 
         server_thread = threading.Thread(target=run_server, daemon=True)
         server_thread.start()
-        logger.info(f"Server started at http://{host}:{port}")
 
-        # Wait for server to be ready
-        import time
-        for _ in range(50):
-            try:
-                import urllib.request
-                urllib.request.urlopen(f"http://{host}:{port}/api/status", timeout=0.5)
-                break
-            except Exception:
-                time.sleep(0.1)
+        # Wait for the server to bind instead of polling /api/status over HTTP
+        if server_ready.wait(timeout=10.0) and server.started:
+            logger.info(f"Server started at http://{host}:{port}")
+        else:
+            logger.error(f"Server did not start at http://{host}:{port}")
+
+        from titrack.api.routes import overlay as overlay_routes
 
         # Create pywebview Api class for JS interop
         class Api:
             def __init__(self):
                 self._window = None
-                self._api_host = host
-                self._api_port = port
 
             def set_window(self, window):
                 self._window = window
@@ -841,20 +871,17 @@ def _serve_with_window(args: argparse.Namespace, settings: Settings,
                 return False
 
             def set_overlay_opacity(self, value):
-                """Set overlay opacity via HTTP API (overlay runs as subprocess)."""
+                """Set overlay opacity (overlay subprocess picks it up on its next poll)."""
                 return self._overlay_config_update({"opacity": float(value)})
 
             def set_overlay_scale(self, scale):
-                """Set overlay scale via HTTP API."""
+                """Set overlay scale."""
                 return self._overlay_config_update({"scale": float(scale)})
 
             def toggle_overlay(self):
-                """Toggle overlay visibility via HTTP API."""
+                """Toggle overlay visibility."""
                 try:
-                    url = f"http://{self._api_host}:{self._api_port}/api/overlay/config"
-                    req = urllib.request.Request(url)
-                    with urllib.request.urlopen(req, timeout=1) as resp:
-                        config = json.loads(resp.read().decode("utf-8"))
+                    config = overlay_routes.get_config(app.state)
                     new_visible = not config.get("visible", True)
                     self._overlay_config_update({"visible": new_visible})
                     return new_visible
@@ -862,27 +889,25 @@ def _serve_with_window(args: argparse.Namespace, settings: Settings,
                     return False
 
             def _overlay_config_update(self, updates):
-                """Send overlay config update to HTTP API."""
+                """Apply an overlay config update in-process (same validation as the API)."""
                 try:
-                    url = f"http://{self._api_host}:{self._api_port}/api/overlay/config"
-                    data = json.dumps(updates).encode("utf-8")
-                    req = urllib.request.Request(url, data=data, method="POST")
-                    req.add_header("Content-Type", "application/json")
-                    with urllib.request.urlopen(req, timeout=1) as resp:
-                        return resp.status == 200
+                    overlay_routes.apply_config_update(
+                        app.state, overlay_routes.OverlayConfigUpdate(**updates)
+                    )
+                    return True
                 except Exception:
                     return False
 
             def set_overlay_lock(self, locked):
-                """Set overlay lock state via HTTP API."""
+                """Set overlay lock state."""
                 return self._overlay_config_update({"locked": bool(locked)})
 
             def set_overlay_columns(self, columns):
-                """Set visible overlay columns via HTTP API."""
+                """Set visible overlay columns."""
                 return self._overlay_config_update({"visible_columns": list(columns)})
 
             def set_overlay_text_shadow(self, enabled):
-                """Set overlay text shadow via HTTP API."""
+                """Set overlay text shadow."""
                 return self._overlay_config_update({"text_shadow": bool(enabled)})
 
 
@@ -1,9 +1,15 @@
 """Collector - main collection loop orchestrating parsing and storage."""
 
-import time
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterator, Optional
+
+# watchfiles (installed with uvicorn[standard]) is optional - plain polling is the fallback
+try:
+    import watchfiles
+except ImportError:
+    watchfiles = None
 
 from titrack.config.logging import get_logger
 from titrack.core.delta_calculator import DeltaCalculator
@@ -131,6 +137,10 @@ class Collector:
         self._init_batch_threshold_seconds = 2.0  # New batch if > 2 seconds gap
 
         self._running = False
+        # Set by stop(); the tail loop waits on it so shutdown doesn't sit out a sleep
+        self._stop_event = threading.Event()
+        # File-change notifications for the log, while tail() runs (None = plain polling)
+        self._log_changes: Optional[Iterator[set]] = None
 
     def set_sync_manager(self, sync_manager: Optional[object]) -> None:
         """
@@ -668,6 +678,8 @@ class Collector:
             Exception: 연속 에러 5회 이상 시
         """
         self._running = True
+        self._stop_event.clear()
+        self._log_changes = self._watch_log_changes(poll_interval)
         consecutive_errors = 0
         max_consecutive_errors = 5
 
@@ -676,7 +688,7 @@ class Collector:
                 line_count = self.process_file()
                 consecutive_errors = 0  # Reset on success
                 if line_count == 0:
-                    time.sleep(poll_interval)
+                    self._wait_for_log_change(poll_interval)
             except Exception as e:
                 consecutive_errors += 1
                 error_msg = str(e)
@@ -695,11 +707,44 @@ class Collector:
 
                 # Wait before retrying (exponential backoff capped at 5 seconds)
                 backoff = min(poll_interval * (2 ** consecutive_errors), 5.0)
-                time.sleep(backoff)
+                self._stop_event.wait(backoff)
+
+    def _watch_log_changes(self, poll_interval: float) -> Optional[Iterator[set]]:
+        """Start an OS-level watch on the log file, or return None to poll instead."""
+        log_path = Path(self.tailer.file_path)
+        if watchfiles is None or not log_path.parent.is_dir():
+            return None
+        log_name = log_path.name
+        return watchfiles.watch(
+            log_path.parent,
+            watch_filter=lambda _change, path: Path(path).name == log_name,
+            # Still wake every poll interval, so a missed or delayed notification
+            # (e.g. Windows updating size lazily for an open file) costs no more than polling
+            rust_timeout=max(int(poll_interval * 1000), 1),
+            yield_on_timeout=True,
+            # Deliver bursts of appended lines promptly instead of batching them for 1.6s
+            debounce=50,
+            step=10,
+            stop_event=self._stop_event,
+        )
+
+    def _wait_for_log_change(self, timeout: float) -> None:
+        """Block until the log changes, stop() is called, or the timeout passes."""
+        if self._log_changes is not None:
+            try:
+                next(self._log_changes)
+                return
+            except StopIteration:
+                self._log_changes = None  # Watch ended (stop() was called)
+            except Exception as e:
+                logger.warning(f"Log file watch failed, falling back to polling: {e}")
+                self._log_changes = None
+        self._stop_event.wait(timeout)
 
     def stop(self) -> None:
         """Stop the tail loop."""
         self._running = False
+        self._stop_event.set()
 
         # End any active run
         ended_run = self.run_segmenter.force_end_current_run()
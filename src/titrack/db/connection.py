@@ -5,7 +5,7 @@ import sqlite3
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Iterable, Iterator
 
 from titrack.db.schema import ALL_CREATE_STATEMENTS, SCHEMA_VERSION
 
@@ -294,7 +294,9 @@ class Database:
                     item.get("url_cn"),
                 ))
 
-            cursor.executemany(insert_sql, items_to_insert)
+            # One transaction for the whole seed instead of a commit per row
+            with self.transaction() as tx:
+                tx.executemany(insert_sql, items_to_insert)
             print(f"Seeded {len(items_to_insert)} items from {seed_path.name}")
 
         except Exception as e:
@@ -316,29 +318,35 @@ class Database:
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Cursor, None, None]:
         """
-        Context manager for database transactions.
+        Context manager for write transactions.
 
         Usage:
             with db.transaction() as cursor:
                 cursor.execute(...)
 
+        Holds the connection lock from BEGIN to COMMIT, so statements from other
+        threads sharing this connection can't start a nested transaction or run
+        inside this one. Use only the yielded cursor inside the block: execute()
+        and friends take the same (non-reentrant) lock.
+
         Automatically commits on success, rolls back on exception.
         """
-        cursor = self.connection.cursor()
-        cursor.execute("BEGIN")
-        try:
-            yield cursor
-            cursor.execute("COMMIT")
-        except Exception:
-            cursor.execute("ROLLBACK")
-            raise
+        with self._lock:
+            cursor = self.connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                yield cursor
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
 
     def execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
         """Execute a single SQL statement."""
         with self._lock:
             return self.connection.execute(sql, params)
 
-    def executemany(self, sql: str, params_seq: list[tuple]) -> sqlite3.Cursor:
+    def executemany(self, sql: str, params_seq: Iterable[tuple]) -> sqlite3.Cursor:
         """Execute a SQL statement for each parameter set."""
         with self._lock:
             return self.connection.executemany(sql, params_seq)
@@ -354,3 +362,14 @@ class Database:
         with self._lock:
             cursor = self.connection.execute(sql, params)
             return cursor.fetchall()
+
+    def iterrows(self, sql: str, params: tuple = (), batch_size: int = 1000) -> Iterator[sqlite3.Row]:
+        """Execute SQL and yield rows in fetchmany() batches instead of materializing them all."""
+        with self._lock:
+            cursor = self.connection.execute(sql, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield from rows
@@ -1,9 +1,10 @@
 """Repository - CRUD operations for all entities."""
 
 import statistics
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
 from titrack.core.models import (
     EventContext,
@@ -18,6 +19,15 @@ from titrack.data.inventory import EXCLUDED_PAGES
 from titrack.data.korean_names import get_korean_name
 from titrack.data.fallback_prices import get_fallback_price
 
+# Keep IN (...) lists under SQLite's default 999 bound-parameter limit
+SQLITE_IN_CHUNK = 900
+
+
+def _chunks(ids: list[int], size: int = SQLITE_IN_CHUNK):
+    """Yield successive slices of ids for chunked IN (...) queries."""
+    for i in range(0, len(ids), size):
+        yield ids[i : i + size]
+
 
 class Repository:
     """Data access layer for all entities."""
@@ -27,6 +37,11 @@ class Repository:
         # Current player context for filtering (set externally)
         self._current_season_id: Optional[int] = None
         self._current_player_id: Optional[str] = None
+        # Lazily built (config_base_id, name_en_lower, name_cn) search index, sorted by name_en.
+        # Reset by every item write made through this repository.
+        self._item_search_index: Optional[list[tuple[int, str, str]]] = None
+        # Bumped on every item write; seeded from the clock so values differ across restarts
+        self._items_revision: int = time.time_ns()
 
     def set_player_context(self, season_id: Optional[int], player_id: Optional[str]) -> None:
         """Set the current player context for filtering queries."""
@@ -37,6 +52,10 @@ class Repository:
         """Return True if a player context has been set."""
         return self._current_player_id is not None
 
+    def get_player_context(self) -> tuple[Optional[int], Optional[str]]:
+        """Return the current (season_id, player_id) context."""
+        return self._current_season_id, self._current_player_id
+
     def _build_excluded_pages_filter(self, include_excluded: bool) -> tuple[str, list]:
         """Build WHERE clause fragment and params for excluded pages filtering.
 
@@ -170,6 +189,146 @@ class Repository:
             )
         return [self._row_to_run(row) for row in rows]
 
+    def get_completed_non_hub_runs(
+        self,
+        limit: int = 10000,
+        season_id: Optional[int] = None,
+        player_id: Optional[str] = None,
+        after_id: Optional[int] = None,
+    ) -> list[Run]:
+        """
+        완료된 비허브 런 목록 조회 (시작 시각 내림차순).
+
+        get_recent_runs와 같은 범위에서 허브 런과 진행 중인 런을 SQL에서 제외한다.
+
+        Args:
+            limit: 조회 개수 제한 (기본값 10000)
+            season_id: 시즌 필터 (None일 경우 컨텍스트 사용)
+            player_id: 플레이어 필터 (None일 경우 컨텍스트 사용)
+            after_id: 지정 시 이 ID보다 큰 런만 조회 (증분 갱신용)
+
+        Returns:
+            end_ts가 있는 비허브 런 리스트 (최신순)
+        """
+        season_id = season_id if season_id is not None else self._current_season_id
+        player_id = player_id if player_id is not None else self._current_player_id
+
+        if self._current_player_id is None and player_id is None:
+            return []
+
+        query = """SELECT * FROM runs
+                   WHERE session_id IS NULL
+                   AND is_hub = 0 AND end_ts IS NOT NULL"""
+        params: list = []
+        if season_id is not None:
+            query += """
+                   AND (season_id IS NULL OR season_id = ?)
+                   AND (player_id IS NULL OR player_id = ?)"""
+            params += [season_id, player_id or '']
+        if after_id is not None:
+            query += " AND id > ?"
+            params.append(after_id)
+        query += " ORDER BY start_ts DESC LIMIT ?"
+        params.append(limit)
+
+        rows = self.db.fetchall(query, tuple(params))
+        return [self._row_to_run(row) for row in rows]
+
+    def get_run_entries_page(
+        self,
+        limit: int,
+        offset: int = 0,
+        season_id: Optional[int] = None,
+        player_id: Optional[str] = None,
+    ) -> tuple[list[list[Run]], int]:
+        """
+        Page through consolidated run-list entries, newest first, with sessions built in SQL.
+
+        Uses the same scope as get_recent_runs. A session is a streak of consecutive
+        non-hub runs (by start_ts) sharing a level_uid; hubs and NULL level_uids break
+        it. Each entry is either all normal runs of a session or a single nightmare run
+        (level_type 11).
+
+        Returns:
+            (entries, total): runs of each entry on the page (ascending start_ts), and the
+            total number of entries
+        """
+        season_id = season_id if season_id is not None else self._current_season_id
+        player_id = player_id if player_id is not None else self._current_player_id
+
+        # Return empty page if no player context is set (awaiting character login)
+        if self._current_player_id is None and player_id is None:
+            return [], 0
+
+        if season_id is not None:
+            scope = """session_id IS NULL
+                       AND (season_id IS NULL OR season_id = ?)
+                       AND (player_id IS NULL OR player_id = ?)"""
+            scope_params: tuple = (season_id, player_id or '')
+        else:
+            scope = "session_id IS NULL"
+            scope_params = ()
+
+        entries_cte = f"""
+            WITH ordered AS (
+                SELECT id, is_hub, level_uid, level_type, start_ts,
+                       LAG(id) OVER w AS prev_id,
+                       LAG(is_hub) OVER w AS prev_hub,
+                       LAG(level_uid) OVER w AS prev_uid
+                FROM runs
+                WHERE {scope}
+                WINDOW w AS (ORDER BY start_ts, id)
+            ),
+            sessions AS (
+                SELECT id, is_hub, level_type, start_ts,
+                       SUM(CASE WHEN prev_id IS NULL OR prev_hub = 1
+                                     OR level_uid IS NULL OR prev_uid IS NULL
+                                     OR level_uid != prev_uid
+                                THEN 1 ELSE 0 END)
+                           OVER (ORDER BY start_ts, id ROWS UNBOUNDED PRECEDING) AS session_no
+                FROM ordered
+            ),
+            entries AS (
+                SELECT CASE WHEN level_type = 11 THEN -id ELSE session_no END AS entry_key,
+                       MIN(start_ts) AS entry_start,
+                       MIN(id) AS first_id,
+                       GROUP_CONCAT(id) AS run_ids
+                FROM sessions
+                WHERE is_hub = 0
+                GROUP BY entry_key
+            )"""
+
+        rows = self.db.fetchall(
+            entries_cte
+            + """
+            SELECT run_ids, COUNT(*) OVER () AS total FROM entries
+            ORDER BY entry_start DESC, first_id DESC
+            LIMIT ? OFFSET ?""",
+            (*scope_params, limit, offset),
+        )
+        if rows:
+            total = rows[0]["total"]
+        else:
+            row = self.db.fetchone(
+                entries_cte + " SELECT COUNT(*) AS total FROM entries", scope_params
+            )
+            total = row["total"] if row else 0
+
+        entry_ids = [[int(i) for i in row["run_ids"].split(",")] for row in rows]
+        runs_by_id: dict[int, Run] = {}
+        for chunk in _chunks([run_id for ids in entry_ids for run_id in ids]):
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.db.fetchall(
+                f"SELECT * FROM runs WHERE id IN ({placeholders})", tuple(chunk)
+            ):
+                runs_by_id[row["id"]] = self._row_to_run(row)
+
+        entries = [
+            sorted((runs_by_id[run_id] for run_id in ids), key=lambda r: (r.start_ts, r.id))
+            for ids in entry_ids
+        ]
+        return entries, total
+
     def get_max_run_id(self) -> int:
         """Get the maximum run ID."""
         row = self.db.fetchone("SELECT MAX(id) as max_id FROM runs")
@@ -374,6 +533,42 @@ class Repository:
         rows = self.db.fetchall(query, tuple(params))
         return [self._row_to_slot_state(row) for row in rows]
 
+    def get_inventory_totals(self, include_excluded: bool = False, player_id: Optional[str] = None) -> dict[int, int]:
+        """
+        Get total quantity per item across all inventory slots (num > 0 only).
+
+        Aggregates in SQL with the same player/excluded-page filtering as
+        get_all_slot_states().
+
+        Returns:
+            {config_base_id: total_quantity}
+        """
+        # Use provided value or fall back to context
+        player_id = player_id if player_id is not None else self._current_player_id
+
+        # Return empty dict if no player context is set (awaiting character login)
+        if self._current_player_id is None and player_id is None:
+            return {}
+
+        where_filter, filter_params = self._build_excluded_pages_filter(include_excluded)
+        conditions = ["num > 0"]
+        params: list = []
+        if player_id is not None:
+            conditions.append("player_id = ?")
+            params.append(player_id if player_id else "")
+        if where_filter:
+            conditions.append(where_filter)
+            params.extend(filter_params)
+
+        rows = self.db.fetchall(
+            f"""SELECT config_base_id, SUM(num) as total
+                FROM slot_state
+                WHERE {" AND ".join(conditions)}
+                GROUP BY config_base_id""",
+            tuple(params),
+        )
+        return {row["config_base_id"]: row["total"] for row in rows}
+
     def get_slot_state(self, page_id: int, slot_id: int, player_id: Optional[str] = None) -> Optional[SlotState]:
         """Get state for a specific slot."""
         # Use provided value or fall back to context
@@ -426,10 +621,27 @@ class Repository:
 
     def upsert_item(self, item: Item) -> None:
         """Insert or update item metadata."""
-        self.db.execute(
-            """INSERT OR REPLACE INTO items
-               (config_base_id, name_en, name_cn, type_cn, icon_url, url_en, url_cn)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
+        try:
+            self.db.execute(
+                """INSERT OR REPLACE INTO items
+                   (config_base_id, name_en, name_cn, type_cn, icon_url, url_en, url_cn)
+                   VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    item.config_base_id,
+                    item.name_en,
+                    item.name_cn,
+                    item.type_cn,
+                    item.icon_url,
+                    item.url_en,
+                    item.url_cn,
+                ),
+            )
+        finally:
+            self._invalidate_items()
+
+    def upsert_items_batch(self, items: Iterable[Item]) -> None:
+        """Insert or update multiple items (any iterable, consumed lazily)."""
+        self.upsert_item_rows(
             (
                 item.config_base_id,
                 item.name_en,
@@ -438,28 +650,31 @@ class Repository:
                 item.icon_url,
                 item.url_en,
                 item.url_cn,
-            ),
+            )
+            for item in items
         )
 
-    def upsert_items_batch(self, items: list[Item]) -> None:
-        """Insert or update multiple items."""
-        self.db.executemany(
-            """INSERT OR REPLACE INTO items
-               (config_base_id, name_en, name_cn, type_cn, icon_url, url_en, url_cn)
-               VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            [
-                (
-                    item.config_base_id,
-                    item.name_en,
-                    item.name_cn,
-                    item.type_cn,
-                    item.icon_url,
-                    item.url_en,
-                    item.url_cn,
+    def upsert_item_rows(self, rows: Iterable[tuple]) -> None:
+        """
+        Insert or update items from raw row tuples in a single transaction,
+        rather than one autocommit per row.
+
+        Each row is (config_base_id, name_en, name_cn, type_cn, icon_url,
+        url_en, url_cn), so bulk loaders can skip building Item objects.
+
+        Raises:
+            Exception: On write failure (after rollback)
+        """
+        try:
+            with self.db.transaction() as cursor:
+                cursor.executemany(
+                    """INSERT OR REPLACE INTO items
+                       (config_base_id, name_en, name_cn, type_cn, icon_url, url_en, url_cn)
+                       VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                    rows,
                 )
-                for item in items
-            ],
-        )
+        finally:
+            self._invalidate_items()
 
     def get_item(self, config_base_id: int) -> Optional[Item]:
         """Get item by ConfigBaseId."""
@@ -470,14 +685,36 @@ class Repository:
             return None
         return self._row_to_item(row)
 
+    def get_items_bulk(self, config_base_ids: list[int]) -> dict[int, Item]:
+        """Get items for many ConfigBaseIds at once, keyed by config_base_id."""
+        ids = list(dict.fromkeys(config_base_ids))
+        items: dict[int, Item] = {}
+        for chunk in _chunks(ids):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.db.fetchall(
+                f"SELECT * FROM items WHERE config_base_id IN ({placeholders})",
+                tuple(chunk),
+            )
+            for row in rows:
+                items[row["config_base_id"]] = self._row_to_item(row)
+        return items
+
     def get_item_name(self, config_base_id: int) -> str:
         """Get item name, preferring Korean name, falling back to English, then Unknown <id>."""
         ko_name = get_korean_name(config_base_id)
         if ko_name:
             return ko_name
         item = self.get_item(config_base_id)
-        if item and item.name_en:
-            return item.name_en
+        return self.resolve_item_name(config_base_id, item.name_en if item else None)
+
+    @staticmethod
+    def resolve_item_name(config_base_id: int, name_en: Optional[str]) -> str:
+        """Resolve a display name from an already-fetched English name (same fallbacks as get_item_name)."""
+        ko_name = get_korean_name(config_base_id)
+        if ko_name:
+            return ko_name
+        if name_en:
+            return name_en
         return f"알 수 없음 {config_base_id}"
 
     def get_all_items(self) -> list[Item]:
@@ -490,18 +727,88 @@ class Repository:
         row = self.db.fetchone("SELECT COUNT(*) as cnt FROM items")
         return row["cnt"] if row else 0
 
+    def _invalidate_items(self) -> None:
+        """
+        Drop the cached search index and bump the items revision.
+
+        Call after the write has committed; invalidating first lets a concurrent
+        read cache the old rows again.
+        """
+        self._item_search_index = None
+        self._items_revision += 1
+
+    def items_revision(self) -> int:
+        """
+        Get an opaque revision number for the items table.
+
+        Changes whenever items are written through this repository; used as the
+        ETag for item listings. Bumped only after the write commits, so a revision
+        read before or during a write is never reused for the written rows.
+        """
+        return self._items_revision
+
+    def search_item_ids(self, search: Optional[str] = None) -> list[int]:
+        """
+        Get item IDs ordered by English name, optionally filtered by a search term.
+
+        Matches case-insensitively against name_en and as-is against name_cn,
+        using a cached pre-lowercased index instead of scanning Item objects.
+        """
+        if self._item_search_index is None:
+            rows = self.db.fetchall(
+                "SELECT config_base_id, name_en, name_cn FROM items "
+                "ORDER BY COALESCE(name_en, ''), config_base_id"
+            )
+            self._item_search_index = [
+                (row["config_base_id"], (row["name_en"] or "").lower(), row["name_cn"] or "")
+                for row in rows
+            ]
+
+        if not search:
+            return [entry[0] for entry in self._item_search_index]
+
+        search_lower = search.lower()
+        return [
+            config_id
+            for config_id, name_en_lower, name_cn in self._item_search_index
+            if search_lower in name_en_lower or search_lower in name_cn
+        ]
+
     def update_item_name(self, config_base_id: int, name_en: str) -> None:
         """Update an item's English name."""
-        self.db.execute(
-            "UPDATE items SET name_en = ? WHERE config_base_id = ?",
-            (name_en, config_base_id),
-        )
+        try:
+            self.db.execute(
+                "UPDATE items SET name_en = ? WHERE config_base_id = ?",
+                (name_en, config_base_id),
+            )
+        finally:
+            self._invalidate_items()
+
+    def update_item_name_returning(self, config_base_id: int, name_en: str) -> Optional[Item]:
+        """
+        Update an item's English name and return the updated item in one statement.
+
+        Returns:
+            The updated Item, or None if no item has this ConfigBaseId
+        """
+        # fetchall() steps the statement to completion so the write is released immediately
+        try:
+            rows = self.db.fetchall(
+                """UPDATE items SET name_en = ? WHERE config_base_id = ?
+                   RETURNING config_base_id, name_en, name_cn, type_cn, icon_url, url_en, url_cn""",
+                (name_en, config_base_id),
+            )
+        finally:
+            self._invalidate_items()
+        if not rows:
+            return None
+        return self._row_to_item(rows[0])
 
     def sync_items_from_cloud(self, cloud_items: list[dict]) -> int:
         """
         Supabase 아이템 데이터를 로컬 SQLite로 동기화.
 
-        배치 UPSERT (100개/배치) + 트랜잭션으로 성능 최적화.
+        단일 트랜잭션 + executemany 한 번으로 전체 아이템을 UPSERT (행별 커밋/fsync 없음).
         현재 스키마는 name_ko 미지원 (items_ko.json 사용, 향후 확장 예정).
 
         Args:
@@ -521,51 +828,39 @@ class Repository:
         if not cloud_items:
             return 0
 
-        # Process items in batches of 100 for performance
-        batch_size = 100
-        synced_count = 0
-
-        conn = self.db.get_connection()
-        conn.execute("BEGIN IMMEDIATE")
+        # Map Supabase fields to SQLite schema lazily (no intermediate list)
+        # Note: name_ko는 items_ko.json에만 저장 (SQLite 스키마에 없음)
+        rows = (
+            (
+                item["config_base_id"],
+                item.get("name_en"),  # English name
+                item.get("name_cn"),  # Chinese name
+                # type_cn: Use type_en if no type_ko (SQLite only has type_cn field)
+                item.get("type_ko") or item.get("type_en"),
+                item.get("icon_url"),
+                item.get("url_tlidb"),  # Store tlidb URL in url_en field
+                None,  # url_cn (not in Supabase schema)
+            )
+            for item in cloud_items
+        )
 
         try:
-            for i in range(0, len(cloud_items), batch_size):
-                batch = cloud_items[i : i + batch_size]
-
-                # Map Supabase fields to SQLite schema
-                # Note: name_ko는 items_ko.json에만 저장 (SQLite 스키마에 없음)
-                values = []
-                for item in batch:
-                    values.append(
-                        (
-                            item["config_base_id"],
-                            item.get("name_en"),  # English name
-                            item.get("name_cn"),  # Chinese name
-                            # type_cn: Use type_en if no type_ko (SQLite only has type_cn field)
-                            item.get("type_ko") or item.get("type_en"),
-                            item.get("icon_url"),
-                            item.get("url_tlidb"),  # Store tlidb URL in url_en field
-                            None,  # url_cn (not in Supabase schema)
-                        )
-                    )
-
-                conn.executemany(
+            with self.db.transaction() as cursor:
+                cursor.executemany(
                     """INSERT OR REPLACE INTO items
                        (config_base_id, name_en, name_cn, type_cn, icon_url, url_en, url_cn)
                        VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                    values,
+                    rows,
                 )
-
-                synced_count += len(batch)
-
-            conn.execute("COMMIT")
-            print(f"Cloud sync: Synced {synced_count} items to local database")
-            return synced_count
-
         except Exception as e:
-            conn.execute("ROLLBACK")
             print(f"Cloud sync: Failed to sync items to local database: {e}")
             raise
+        finally:
+            self._invalidate_items()
+
+        synced_count = len(cloud_items)
+        print(f"Cloud sync: Synced {synced_count} items to local database")
+        return synced_count
 
     def _row_to_item(self, row) -> Item:
         return Item(
@@ -744,8 +1039,6 @@ class Repository:
         Get the effective price and its source for an item.
         Returns (price, source) where source is 'exchange', 'cloud', 'local', or 'fallback'.
         """
-        from datetime import datetime
-
         season_id = season_id if season_id is not None else self._current_season_id
         season_id_filter = season_id if season_id is not None else 0
 
@@ -760,6 +1053,86 @@ class Repository:
             (config_base_id, season_id_filter),
         )
 
+        return self._resolve_price_with_source(config_base_id, cloud_row, local_row)
+
+    def get_effective_prices_with_source_bulk(
+        self, config_base_ids: list[int], season_id: Optional[int] = None
+    ) -> dict[int, tuple[Optional[float], Optional[str]]]:
+        """
+        Bulk variant of get_effective_price_with_source.
+
+        Fetches cloud and local price rows with one IN (...) query per table (per chunk)
+        and resolves each item with the same precedence rules.
+
+        Returns:
+            {config_base_id: (price, source)} for every requested ID
+        """
+        season_id = season_id if season_id is not None else self._current_season_id
+        season_id_filter = season_id if season_id is not None else 0
+
+        ids = list(dict.fromkeys(config_base_ids))
+        cloud_rows: dict[int, dict] = {}
+        local_rows: dict[int, dict] = {}
+        for chunk in _chunks(ids):
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.db.fetchall(
+                f"""SELECT config_base_id, price_fe_median, cloud_updated_at, unique_devices
+                    FROM cloud_price_cache
+                    WHERE season_id = ? AND unique_devices >= 1
+                    AND config_base_id IN ({placeholders})""",
+                (season_id_filter, *chunk),
+            ):
+                cloud_rows[row["config_base_id"]] = row
+            for row in self.db.fetchall(
+                f"""SELECT config_base_id, price_fe, updated_at, source FROM prices
+                    WHERE season_id = ? AND config_base_id IN ({placeholders})""",
+                (season_id_filter, *chunk),
+            ):
+                local_rows[row["config_base_id"]] = row
+
+        return {
+            config_id: self._resolve_price_with_source(
+                config_id, cloud_rows.get(config_id), local_rows.get(config_id)
+            )
+            for config_id in ids
+        }
+
+    def get_effective_prices_bulk(
+        self, config_base_ids: list[int], season_id: Optional[int] = None
+    ) -> dict[int, Optional[float]]:
+        """Bulk variant of get_effective_price: {config_base_id: price or None}."""
+        return {
+            config_id: price
+            for config_id, (price, _) in self.get_effective_prices_with_source_bulk(
+                config_base_ids, season_id
+            ).items()
+        }
+
+    def get_prices_fingerprint(self) -> tuple:
+        """
+        Cheap fingerprint of the local and cloud price tables.
+
+        Changes when prices are added, removed or updated, from any connection
+        (the collector writes exchange prices through its own repository), so
+        callers can tell whether cached valuations are still current.
+        """
+        row = self.db.fetchone(
+            """SELECT
+                 (SELECT COUNT(*) FROM prices) AS local_count,
+                 (SELECT TOTAL(price_fe) FROM prices) AS local_total,
+                 (SELECT MAX(updated_at) FROM prices) AS local_updated,
+                 (SELECT TOTAL(source = 'exchange') FROM prices) AS local_exchange,
+                 (SELECT COUNT(*) FROM cloud_price_cache) AS cloud_count,
+                 (SELECT TOTAL(price_fe_median) FROM cloud_price_cache) AS cloud_total,
+                 (SELECT MAX(cached_at) FROM cloud_price_cache) AS cloud_cached"""
+        )
+        return tuple(row)
+
+    @staticmethod
+    def _resolve_price_with_source(
+        config_base_id: int, cloud_row, local_row
+    ) -> tuple[Optional[float], Optional[str]]:
+        """Apply exchange/cloud/local/fallback precedence to already-fetched price rows."""
         cloud_price = cloud_row["price_fe_median"] if cloud_row else None
         local_price = local_row["price_fe"] if local_row else None
         local_source = local_row["source"] if local_row else None
@@ -833,6 +1206,32 @@ class Repository:
         )
         return [self._row_to_price(row) for row in rows]
 
+    def get_prices_with_names(self, season_id: Optional[int] = None) -> list[tuple[Price, Optional[str]]]:
+        """
+        Get all prices for a season together with each item's English name.
+
+        Single LEFT JOIN against items instead of one get_item() per price.
+
+        Returns:
+            List of (price, name_en) tuples ordered by name_en; name_en is None for unknown items
+        """
+        return list(self.iter_prices_with_names(season_id))
+
+    def iter_prices_with_names(self, season_id: Optional[int] = None) -> Iterator[tuple[Price, Optional[str]]]:
+        """Streaming variant of get_prices_with_names (rows are fetched in batches)."""
+        season_id = season_id if season_id is not None else self._current_season_id
+        season_id_filter = season_id if season_id is not None else 0
+
+        rows = self.db.iterrows(
+            """SELECT p.*, i.name_en AS item_name_en
+               FROM prices p LEFT JOIN items i ON i.config_base_id = p.config_base_id
+               WHERE p.season_id = ?
+               ORDER BY COALESCE(i.name_en, ''), p.config_base_id""",
+            (season_id_filter,),
+        )
+        for row in rows:
+            yield self._row_to_price(row), row["item_name_en"]
+
     def get_exchange_price_ids(self, season_id: Optional[int] = None) -> list[int]:
         """Get config_base_ids that have user-learned prices from AH (source='exchange')."""
         season_id = season_id if season_id is not None else self._current_season_id
@@ -856,23 +1255,38 @@ class Repository:
         )
         return row["cnt"] if row else 0
 
-    def upsert_prices_batch(self, prices: list[Price]) -> None:
-        """Insert or update multiple prices."""
-        self.db.executemany(
-            """INSERT OR REPLACE INTO prices
-               (config_base_id, season_id, price_fe, source, updated_at)
-               VALUES (?, ?, ?, ?, ?)""",
-            [
-                (
-                    price.config_base_id,
-                    price.season_id if price.season_id is not None else 0,
-                    price.price_fe,
-                    price.source,
-                    price.updated_at.isoformat(),
-                )
-                for price in prices
-            ],
-        )
+    def upsert_prices_batch(self, prices: Iterable[Price]) -> None:
+        """
+        Insert or update multiple prices in a single transaction (one commit for the batch).
+
+        Raises:
+            Exception: On write failure (after rollback)
+        """
+        rows = [
+            (
+                price.config_base_id,
+                price.season_id if price.season_id is not None else 0,
+                price.price_fe,
+                price.source,
+                price.updated_at.isoformat(),
+            )
+            for price in prices
+        ]
+        if not rows:
+            return
+
+        # Locked for the whole transaction: API threadpool workers share this connection
+        with self.db.transaction() as cursor:
+            cursor.executemany(
+                """INSERT INTO prices
+                   (config_base_id, season_id, price_fe, source, updated_at)
+                   VALUES (?, ?, ?, ?, ?)
+                   ON CONFLICT(config_base_id, season_id) DO UPDATE SET
+                       price_fe = excluded.price_fe,
+                       source = excluded.source,
+                       updated_at = excluded.updated_at""",
+                rows,
+            )
 
     def migrate_legacy_prices(self, target_season_id: int) -> int:
         """
@@ -997,6 +1411,115 @@ class Repository:
 
         return summary, total_cost, unpriced
 
+    def get_run_summaries_batch(
+        self, run_ids: list[int], include_excluded: bool = False
+    ) -> dict[int, dict[int, int]]:
+        """
+        Batch variant of get_run_summary: one grouped query per chunk of run IDs.
+
+        Returns:
+            {run_id: {config_base_id: total_delta}}; runs without loot are omitted
+        """
+        where_filter, filter_params = self._build_excluded_pages_filter(include_excluded)
+        extra = f" AND {where_filter}" if where_filter else ""
+
+        summaries: dict[int, dict[int, int]] = {}
+        for chunk in _chunks(list(dict.fromkeys(run_ids))):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.db.fetchall(
+                f"""SELECT run_id, config_base_id, SUM(delta) as total_delta
+                    FROM item_deltas
+                    WHERE run_id IN ({placeholders})
+                    AND (proto_name IS NULL OR proto_name != 'Spv3Open'){extra}
+                    GROUP BY run_id, config_base_id""",
+                (*chunk, *filter_params),
+            )
+            for row in rows:
+                summaries.setdefault(row["run_id"], {})[row["config_base_id"]] = row["total_delta"]
+        return summaries
+
+    def get_run_values_batch(
+        self,
+        run_ids: list[int],
+        summaries: Optional[dict[int, dict[int, int]]] = None,
+        tax_multiplier: Optional[float] = None,
+    ) -> dict[int, tuple[int, float]]:
+        """
+        Batch variant of get_run_value.
+
+        Args:
+            run_ids: Runs to value
+            summaries: Already-fetched get_run_summaries_batch() result, if the caller has one
+            tax_multiplier: Already-read trade tax multiplier (read from settings if None)
+
+        Returns:
+            {run_id: (raw_fe_gained, total_value_fe)} for every requested run
+        """
+        from titrack.parser.patterns import FE_CONFIG_BASE_ID
+
+        if summaries is None:
+            summaries = self.get_run_summaries_batch(run_ids)
+        prices = self.get_effective_prices_bulk(
+            list({config_id for summary in summaries.values() for config_id in summary})
+        )
+        if tax_multiplier is None:
+            tax_multiplier = self.get_trade_tax_multiplier()
+
+        values: dict[int, tuple[int, float]] = {}
+        for run_id in run_ids:
+            summary = summaries.get(run_id, {})
+            raw_fe = summary.get(FE_CONFIG_BASE_ID, 0)
+            total_value = float(raw_fe)
+            for config_id, quantity in summary.items():
+                if config_id == FE_CONFIG_BASE_ID or quantity <= 0:
+                    continue
+                price_fe = prices.get(config_id)
+                if price_fe and price_fe > 0:
+                    total_value += price_fe * quantity * tax_multiplier
+            values[run_id] = (raw_fe, total_value)
+        return values
+
+    def get_run_costs_batch(
+        self, run_ids: list[int]
+    ) -> dict[int, tuple[dict[int, int], float, list[int]]]:
+        """
+        Batch variant of get_run_cost.
+
+        Returns:
+            {run_id: (cost_summary, total_cost_fe, unpriced_config_ids)} for every requested run
+        """
+        cost_summaries: dict[int, dict[int, int]] = {}
+        for chunk in _chunks(list(dict.fromkeys(run_ids))):
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.db.fetchall(
+                f"""SELECT run_id, config_base_id, SUM(delta) as total_delta
+                    FROM item_deltas
+                    WHERE run_id IN ({placeholders}) AND proto_name = 'Spv3Open'
+                    GROUP BY run_id, config_base_id""",
+                tuple(chunk),
+            )
+            for row in rows:
+                cost_summaries.setdefault(row["run_id"], {})[row["config_base_id"]] = row["total_delta"]
+
+        prices = self.get_effective_prices_bulk(
+            list({config_id for summary in cost_summaries.values() for config_id in summary})
+        )
+
+        costs: dict[int, tuple[dict[int, int], float, list[int]]] = {}
+        for run_id in run_ids:
+            summary = cost_summaries.get(run_id, {})
+            total_cost = 0.0
+            unpriced: list[int] = []
+            for config_id, quantity in summary.items():
+                price_fe = prices.get(config_id)
+                if price_fe and price_fe > 0:
+                    # Consumed, not sold: absolute quantity, no trade tax
+                    total_cost += abs(quantity) * price_fe
+                else:
+                    unpriced.append(config_id)
+            costs[run_id] = (summary, total_cost, unpriced)
+        return costs
+
     # --- Data Management ---
 
     def clear_run_data(self) -> int:
@@ -1135,6 +1658,37 @@ class Repository:
             for row in rows
         ]
 
+    def get_total_gross_value_fe(
+        self, tax_multiplier: Optional[float] = None, season_id: Optional[int] = None,
+        player_id: Optional[str] = None,
+    ) -> float:
+        """
+        Total value of the cumulative loot: FE 1:1, other items at effective price x tax.
+
+        Quantities are summed in SQL and prices resolved with one bulk lookup; price
+        precedence (exchange/cloud/local timestamps, bundled fallbacks) stays in Python.
+        """
+        from titrack.parser.patterns import FE_CONFIG_BASE_ID
+
+        if tax_multiplier is None:
+            tax_multiplier = self.get_trade_tax_multiplier()
+        loot = self.get_cumulative_loot(season_id, player_id)
+        prices = self.get_effective_prices_bulk(
+            [row["config_base_id"] for row in loot], season_id
+        )
+
+        values = []
+        for row in loot:
+            config_id = row["config_base_id"]
+            quantity = row["total_quantity"]
+            if config_id == FE_CONFIG_BASE_ID:
+                values.append(float(quantity))
+            else:
+                price_fe = prices[config_id]
+                if price_fe and price_fe > 0:
+                    values.append(price_fe * quantity * tax_multiplier)
+        return sum(values, 0.0)
+
     def get_completed_run_count(
         self, season_id: Optional[int] = None, player_id: Optional[str] = None
     ) -> int:
@@ -1339,11 +1893,12 @@ class Repository:
             run_count = len(rows)
             total_net_profit = 0.0
 
-            for row in rows:
-                rid = row[0]
-                _, run_value = self.get_run_value(rid)
-                _, run_cost, _ = self.get_run_cost(rid)
-                total_net_profit += run_value - run_cost
+            # Values and costs for all linked runs in batched queries
+            run_ids = [row[0] for row in rows]
+            run_values = self.get_run_values_batch(run_ids)
+            run_costs = self.get_run_costs_batch(run_ids)
+            for rid in run_ids:
+                total_net_profit += run_values[rid][1] - run_costs[rid][1]
 
             # Update session with calculated values
             conn.execute(
@@ -1457,10 +2012,15 @@ class Repository:
         surgery_profit = 0.0
         SURGERY_ZONE_KEY = "DiXiaZhenSuo"
 
+        # Values and costs for every run in batched queries (prices resolved once)
+        run_ids = [rrow["id"] for rrow in run_rows]
+        run_values = self.get_run_values_batch(run_ids)
+        run_costs = self.get_run_costs_batch(run_ids)
+
         for rrow in run_rows:
             rid = rrow["id"]
-            _, run_value = self.get_run_value(rid)
-            _, run_cost, _ = self.get_run_cost(rid)
+            run_value = run_values[rid][1]
+            run_cost = run_costs[rid][1]
             net_profit = run_value - run_cost
             run_profits.append(net_profit)
             total_gross_value += run_value
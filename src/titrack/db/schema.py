@@ -38,6 +38,11 @@ CREATE_RUNS_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_runs_start_ts ON runs(start_ts)
 """
 
+# Completed (non-hub, ended) run lookups
+CREATE_RUNS_COMPLETED_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_runs_completed ON runs(is_hub, end_ts)
+"""
+
 # Item deltas - per-item changes
 CREATE_ITEM_DELTAS = """
 CREATE TABLE IF NOT EXISTS item_deltas (
@@ -182,6 +187,7 @@ ALL_CREATE_STATEMENTS = [
     CREATE_SETTINGS,
     CREATE_RUNS,
     CREATE_RUNS_INDEX,
+    CREATE_RUNS_COMPLETED_INDEX,
     CREATE_ITEM_DELTAS,
     CREATE_ITEM_DELTAS_INDEX,
     CREATE_ITEM_DELTAS_CONFIG_INDEX,
@@ -457,6 +457,9 @@ class OverlayManager:
         # Text shadow toggle
         self._text_shadow = True
 
+        # ETag of the last overlay config received (unchanged polls get a 304)
+        self._config_etag = None
+
         # Shared data (updated by API polling thread)
         self._data = {
             "profit": "--",
@@ -1140,7 +1143,7 @@ class OverlayManager:
 
         while self._running:
             try:
-                data = self._http_get(f"{base}/overlay/config")
+                data = self._http_get_config(f"{base}/overlay/config")
                 if data:
                     # Opacity
                     opacity = data.get("opacity", 0.9)
@@ -1306,6 +1309,21 @@ class OverlayManager:
             pass
         return None
 
+    def _http_get_config(self, url):
+        """GET overlay config, returning None when unchanged since the last poll (304)."""
+        try:
+            req = urllib.request.Request(url, method="GET")
+            if self._config_etag:
+                req.add_header("If-None-Match", self._config_etag)
+            with urllib.request.urlopen(req, timeout=2) as resp:
+                if resp.status == 200:
+                    self._config_etag = resp.headers.get("ETag")
+                    return json.loads(resp.read().decode("utf-8"))
+        except Exception:
+            # urllib raises HTTPError for 304 Not Modified
+            pass
+        return None
+
     def _http_post_config(self, updates):
         """POST config update to API."""
         try:
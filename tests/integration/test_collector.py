@@ -1,6 +1,8 @@
 """Integration tests for the collector."""
 
 import tempfile
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -299,3 +301,52 @@ class TestCollectorIntegration:
         # Final state should be 550
         fe_state = repo.get_slot_state(102, 0)
         assert fe_state.num == 550
+
+    def test_stop_interrupts_idle_tail(self, test_env):
+        """stop() wakes a tail loop that is waiting for new lines."""
+        collector = Collector(db=test_env["db"], log_path=test_env["log_path"])
+        collector.initialize()
+        collector.process_file(from_beginning=True)
+
+        thread = threading.Thread(target=collector.tail, kwargs={"poll_interval": 30.0})
+        thread.start()
+        time.sleep(0.2)  # Let the loop reach its idle wait
+
+        collector.stop()
+        thread.join(timeout=2.0)
+        assert not thread.is_alive()
+
+    def test_tail_wakes_on_log_change(self, test_env):
+        """With watchfiles available, appended lines are picked up without waiting a poll interval."""
+        pytest.importorskip("watchfiles")
+        log_path = test_env["log_path"]
+        deltas_received = []
+
+        collector = Collector(
+            db=test_env["db"],
+            log_path=log_path,
+            on_delta=lambda d: deltas_received.append(d),
+        )
+        collector.initialize()
+        collector.process_file(from_beginning=True)
+        deltas_received.clear()
+
+        thread = threading.Thread(target=collector.tail, kwargs={"poll_interval": 30.0})
+        thread.start()
+        try:
+            time.sleep(0.2)  # Let the loop reach its idle wait
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(
+                    "[2026.01.26-10.06.00:000][  0]GameLog: Display: [Game] ItemChange@ ProtoName=PickItems start\n"
+                    "[2026.01.26-10.06.00:001][  0]GameLog: Display: [Game] BagMgr@:Modfy BagItem PageId = 102 SlotId = 0 ConfigBaseId = 100300 Num = 710\n"
+                    "[2026.01.26-10.06.00:002][  0]GameLog: Display: [Game] ItemChange@ ProtoName=PickItems end\n"
+                )
+
+            deadline = time.monotonic() + 5.0
+            while not deltas_received and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            collector.stop()
+            thread.join(timeout=2.0)
+
+        assert [d.delta for d in deltas_received] == [10]
@@ -177,6 +177,66 @@ class TestInventoryEndpoint:
         assert len(data["items"]) == 1
         assert data["total_fe"] == 500
 
+    def test_get_inventory_sorting(self, db, repo):
+        from titrack.parser.player_parser import PlayerInfo, get_effective_player_id
+
+        player_info = PlayerInfo(name="Tester", level=90, season_id=1, hero_id=1, player_id="p1")
+        player_id = get_effective_player_id(player_info)
+        now = datetime.now()
+        stock = [(FE_CONFIG_BASE_ID, 500), (990001, 3), (990002, 10), (990003, 1)]
+        for slot_id, (config_id, num) in enumerate(stock):
+            if config_id != FE_CONFIG_BASE_ID:
+                repo.upsert_item(
+                    Item(
+                        config_base_id=config_id,
+                        name_en=f"Item {'CAB'[slot_id - 1]}",
+                        name_cn=None,
+                        type_cn=None,
+                        icon_url=None,
+                        url_en=None,
+                        url_cn=None,
+                    )
+                )
+            repo.upsert_slot_state(
+                SlotState(
+                    page_id=102,
+                    slot_id=slot_id,
+                    config_base_id=config_id,
+                    num=num,
+                    updated_at=now,
+                    player_id=player_id,
+                )
+            )
+        repo.upsert_price(
+            Price(config_base_id=990001, price_fe=100.0, source="manual", updated_at=now, season_id=1)
+        )
+
+        client = TestClient(create_app(db, player_info=player_info))
+
+        def order(params):
+            data = client.get("/api/inventory", params=params).json()
+            return [it["config_base_id"] for it in data["items"]]
+
+        assert order({"sort_by": "value", "sort_order": "desc"})[:2] == [FE_CONFIG_BASE_ID, 990001]
+        assert order({"sort_by": "quantity", "sort_order": "asc"}) == [
+            FE_CONFIG_BASE_ID, 990003, 990001, 990002,
+        ]
+        assert order({"sort_by": "name", "sort_order": "asc"}) == [
+            FE_CONFIG_BASE_ID, 990002, 990003, 990001,
+        ]
+        assert order({"sort_by": "name", "sort_order": "desc"}) == [
+            FE_CONFIG_BASE_ID, 990001, 990003, 990002,
+        ]
+
+        page = client.get(
+            "/api/inventory",
+            params={"sort_by": "quantity", "sort_order": "asc", "limit": 2, "offset": 1},
+        ).json()
+        assert [it["config_base_id"] for it in page["items"]] == [990003, 990001]
+        assert page["total"] == 4
+        assert page["total_fe"] == 500
+        assert page["net_worth_fe"] == round(500 + 300 * repo.get_trade_tax_multiplier(), 2)
+
 
 class TestItemsEndpoints:
     def test_list_items_empty(self, client):
@@ -217,6 +277,34 @@ class TestItemsEndpoints:
         response = client.get("/api/items/999999")
         assert response.status_code == 404
 
+    def test_update_item_name(self, seeded_db):
+        app = create_app(seeded_db)
+        client = TestClient(app)
+
+        response = client.patch("/api/items/200001", json={"name_en": "Renamed Item"})
+        assert response.status_code == 200
+        data = response.json()
+        assert data["name_en"] == "Renamed Item"
+        assert data["icon_url"] == "https://example.com/item.png"
+        assert client.get("/api/items/200001").json()["name_en"] == "Renamed Item"
+
+    def test_list_items_etag(self, seeded_db):
+        app = create_app(seeded_db)
+        client = TestClient(app)
+
+        etag = client.get("/api/items").headers["etag"]
+        cached = client.get("/api/items", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        # Writes bump the items revision
+        client.patch("/api/items/200001", json={"name_en": "Renamed Item"})
+        assert client.get("/api/items", headers={"If-None-Match": etag}).status_code == 200
+
+    def test_update_item_not_found(self, client):
+        response = client.patch("/api/items/999999", json={"name_en": "Nothing"})
+        assert response.status_code == 404
+
 
 class TestStatsEndpoints:
     def test_get_stats_history_empty(self, client):
@@ -238,6 +326,40 @@ class TestStatsEndpoints:
         assert len(data["cumulative_value"]) == 1
         assert data["cumulative_value"][0]["value"] == 100  # FE from seeded run (no prices)
 
+    def test_get_stats_history_incremental(self, db, repo):
+        from titrack.parser.player_parser import PlayerInfo
+
+        player_info = PlayerInfo(name="Tester", level=90, season_id=1, hero_id=1, player_id="p1")
+        client = TestClient(create_app(db, player_info=player_info))
+        start = datetime.now() - timedelta(hours=1)
+
+        def add_run(minutes: int, config_id: int, delta: int) -> None:
+            run_start = start + timedelta(minutes=minutes)
+            run_id = repo.insert_run(
+                Run(id=None, zone_signature="Map", start_ts=run_start,
+                    end_ts=run_start + timedelta(minutes=5), is_hub=False)
+            )
+            repo.insert_delta(
+                ItemDelta(page_id=102, slot_id=0, config_base_id=config_id, delta=delta,
+                          context=EventContext.PICK_ITEMS, proto_name="PickItems",
+                          run_id=run_id, timestamp=run_start)
+            )
+
+        add_run(0, FE_CONFIG_BASE_ID, 100)
+        data = client.get("/api/stats/history").json()
+        assert [p["value"] for p in data["cumulative_value"]] == [100]
+
+        # Newly completed runs extend the cached series
+        add_run(10, 200001, 2)
+        data = client.get("/api/stats/history").json()
+        assert [p["value"] for p in data["cumulative_value"]] == [100, 100]
+
+        # A price change re-values every run
+        client.put("/api/prices/200001", json={"price_fe": 10.0, "source": "manual"})
+        data = client.get("/api/stats/history").json()
+        assert [p["value"] for p in data["cumulative_value"]] == [100, 117.5]  # 2 x 10.0 after trade tax
+        assert [p["value"] for p in data["cumulative_fe"]] == [100, 100]
+
 
 class TestPricesEndpoints:
     def test_list_prices_empty(self, client):
@@ -255,6 +377,19 @@ class TestPricesEndpoints:
         data = response.json()
         assert len(data["prices"]) == 1
         assert data["prices"][0]["price_fe"] == 10.5
+        assert data["prices"][0]["name"] == "Test Item"
+
+    def test_export_prices(self, seeded_db):
+        app = create_app(seeded_db)
+        client = TestClient(app)
+
+        response = client.get("/api/prices/export")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["meta"]["count"] == 1
+        assert data["prices"] == [
+            {"id": "200001", "name_en": "Test Item", "price_fe": 10.5, "source": "manual"}
+        ]
 
     def test_get_price_not_found(self, client):
         response = client.get("/api/prices/999999")
@@ -276,6 +411,26 @@ class TestPricesEndpoints:
         response = client.get("/api/prices/200001")
         assert response.json()["price_fe"] == 20.0
 
+    def test_update_prices_bulk(self, seeded_db):
+        app = create_app(seeded_db)
+        client = TestClient(app)
+
+        response = client.put(
+            "/api/prices/bulk",
+            json=[
+                {"config_base_id": 200001, "price_fe": 30.0},
+                {"config_base_id": 300001, "price_fe": 2.0, "source": "exchange",
+                 "updated_at": "2026-01-26T10:00:00"},
+            ],
+        )
+        assert response.status_code == 200
+        assert response.json() == {"updated": 2}
+
+        assert client.get("/api/prices/200001").json()["price_fe"] == 30.0
+        data = client.get("/api/prices/300001").json()
+        assert data["source"] == "exchange"
+        assert data["updated_at"] == "2026-01-26T10:00:00"
+
     def test_create_price(self, seeded_db):
         app = create_app(seeded_db)
         client = TestClient(app)
@@ -317,3 +472,113 @@ class TestIconsEndpoint:
         response = client.get("/api/icons/999888")
         assert response.status_code == 404
         assert "No icon available" in response.json()["detail"]
+
+    def test_failed_icon_url_expires(self, monkeypatch):
+        """Negative-cached icon URLs are retried once their TTL has passed."""
+        from titrack.api.routes import icons
+
+        url = "https://evil.example.com/icon.png"
+        monkeypatch.setattr(icons, "_failed_urls", {})
+        now = [1000.0]
+        monkeypatch.setattr(icons.time, "monotonic", lambda: now[0])
+
+        assert icons._fetch_icon(url) is None
+        assert icons._failed_urls[url] == 1000.0 + icons.FAILED_TTL_BLOCKED
+
+        now[0] += icons.FAILED_TTL_BLOCKED + 1
+        icons._mark_failed("https://other.example.com/a.png", icons.FAILED_TTL_TRANSIENT)
+        assert icons._failed_urls.get(url, 0) < now[0]
+
+
+class TestOverlayEndpoints:
+    def test_get_overlay_config_defaults(self, client):
+        response = client.get("/api/overlay/config")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["opacity"] == 0.9
+        assert data["visible_columns"][0] == "profit"
+
+    def test_overlay_config_backfills_missing_keys(self, db):
+        app = create_app(db)
+        app.state.overlay_config = {"opacity": 0.5}
+        client = TestClient(app)
+
+        data = client.get("/api/overlay/config").json()
+        assert data["opacity"] == 0.5
+        assert data["preset"] == 1
+
+    def test_update_overlay_config(self, client):
+        response = client.post(
+            "/api/overlay/config",
+            json={"opacity": 0.5, "visible_columns": ["run_time", "bogus", "profit"]},
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["opacity"] == 0.5
+        assert data["scale"] == 1.0
+        assert data["visible_columns"] == ["run_time", "profit"]
+
+    def test_overlay_config_etag(self, client):
+        etag = client.get("/api/overlay/config").headers["etag"]
+        assert client.get("/api/overlay/config", headers={"If-None-Match": etag}).status_code == 304
+
+        client.post("/api/overlay/config", json={"opacity": 0.5})
+        response = client.get("/api/overlay/config", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["opacity"] == 0.5
+
+    def test_update_overlay_config_out_of_range(self, client):
+        response = client.post("/api/overlay/config", json={"preset": 7})
+        assert response.status_code == 422
+        assert client.get("/api/overlay/config").json()["preset"] == 1
+
+    def test_in_process_config_update(self, db):
+        from titrack.api.routes.overlay import OverlayConfigUpdate, apply_config_update
+
+        app = create_app(db)
+        client = TestClient(app)
+        etag = client.get("/api/overlay/config").headers["etag"]
+
+        apply_config_update(app.state, OverlayConfigUpdate(visible=False))
+
+        response = client.get("/api/overlay/config", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["visible"] is False
+
+
+class TestTimeEndpoints:
+    def test_get_time_state(self, client):
+        data = client.get("/api/time").json()
+        assert data["total_play_state"] == "stopped"
+        assert data["pause_settings"]["bag"] is True
+
+        client.app.state.time_tracker = None
+        assert client.get("/api/time").json()["total_play_seconds"] == 0.0
+
+    def test_time_actions(self, client):
+        time_tracker = client.app.state.time_tracker
+
+        assert client.post("/api/time/start").json() == {"success": True}
+        assert time_tracker.total_play_state.value == "playing"
+        client.post("/api/time/pause")
+        assert time_tracker.total_play_state.value == "paused"
+        client.post("/api/time/resume")
+        assert time_tracker.total_play_state.value == "playing"
+        client.post("/api/time/stop")
+        assert time_tracker.total_play_state.value == "stopped"
+        assert client.post("/api/time/reset/all").json() == {"success": True}
+
+    def test_time_actions_without_tracker(self, client):
+        client.app.state.time_tracker = None
+        assert client.post("/api/time/reset/mapping").json() == {"success": True}
+
+    def test_time_actions_under_mount(self, client):
+        from fastapi import FastAPI
+
+        parent = FastAPI()
+        parent.mount("/titrack", client.app)
+        time_tracker = client.app.state.time_tracker
+
+        response = TestClient(parent).post("/titrack/api/time/start")
+        assert response.json() == {"success": True}
+        assert time_tracker.total_play_state.value == "playing"
@@ -1,6 +1,7 @@
 """Tests for database repository."""
 
 import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -129,6 +130,44 @@ class TestRunsRepository:
         # Should be in descending order by start time
         assert runs[0].zone_signature == "Map_4"
 
+    def test_get_completed_non_hub_runs(self, repo):
+        repo.set_player_context(1, "p1")
+        start = datetime(2026, 1, 26, 10, 0, 0)
+        done = repo.insert_run(
+            Run(id=None, zone_signature="Map_A", start_ts=start, end_ts=start.replace(minute=5))
+        )
+        repo.insert_run(
+            Run(id=None, zone_signature="Hub", start_ts=start.replace(minute=6),
+                end_ts=start.replace(minute=7), is_hub=True)
+        )
+        repo.insert_run(Run(id=None, zone_signature="Map_B", start_ts=start.replace(minute=8)))
+
+        runs = repo.get_completed_non_hub_runs()
+        assert [r.id for r in runs] == [done]
+        assert len(runs) == repo.get_completed_run_count()
+
+    def test_get_run_entries_page(self, repo):
+        repo.set_player_context(1, "p1")
+        # (is_hub, level_uid, level_type): map A split by a nightmare, hub, map B, map C
+        layout = [(False, 7, 3), (False, 7, 11), (False, 7, 3), (True, None, None),
+                  (False, 8, 3), (False, 9, 3)]
+        ids = [
+            repo.insert_run(
+                Run(id=None, zone_signature="Map", start_ts=datetime(2026, 1, 26, 10, i),
+                    is_hub=is_hub, level_uid=uid, level_type=level_type)
+            )
+            for i, (is_hub, uid, level_type) in enumerate(layout)
+        ]
+
+        entries, total = repo.get_run_entries_page(limit=2, offset=0)
+        assert total == 4
+        assert [[r.id for r in entry] for entry in entries] == [[ids[5]], [ids[4]]]
+
+        entries, _ = repo.get_run_entries_page(limit=2, offset=2)
+        assert [[r.id for r in entry] for entry in entries] == [[ids[1]], [ids[0], ids[2]]]
+
+        assert repo.get_run_entries_page(limit=2, offset=10) == ([], 4)
+
 
 class TestItemDeltasRepository:
     """Tests for item deltas CRUD."""
@@ -187,6 +226,30 @@ class TestItemDeltasRepository:
         summary = repo.get_run_summary(run_id)
         assert summary[100300] == 175  # 50 + 25 + 100
 
+    def test_run_batches_match_single(self, repo):
+        repo.upsert_price(
+            Price(config_base_id=200001, price_fe=2.0, source="manual", updated_at=datetime.now())
+        )
+        run_ids = []
+        for i in range(3):
+            run_id = repo.insert_run(
+                Run(id=None, zone_signature=f"Map_{i}", start_ts=datetime(2026, 1, 26, i), is_hub=False)
+            )
+            run_ids.append(run_id)
+            for config_id, delta, proto in [(100300, 10 * i, "PickItems"), (200001, i, "PickItems"),
+                                            (200001, -1, "Spv3Open")]:
+                if delta:
+                    repo.insert_delta(
+                        ItemDelta(page_id=102, slot_id=0, config_base_id=config_id, delta=delta,
+                                  context=EventContext.PICK_ITEMS, proto_name=proto, run_id=run_id,
+                                  timestamp=datetime.now())
+                    )
+
+        summaries = repo.get_run_summaries_batch(run_ids)
+        assert summaries == {r: repo.get_run_summary(r) for r in run_ids if repo.get_run_summary(r)}
+        assert repo.get_run_values_batch(run_ids) == {r: repo.get_run_value(r) for r in run_ids}
+        assert repo.get_run_costs_batch(run_ids) == {r: repo.get_run_cost(r) for r in run_ids}
+
 
 class TestSlotStateRepository:
     """Tests for slot state CRUD."""
@@ -241,6 +304,23 @@ class TestSlotStateRepository:
         states = repo.get_all_slot_states()
         assert len(states) == 3
 
+    def test_get_inventory_totals(self, repo):
+        repo.set_player_context(1, "p1")
+        stock = [(0, 100300, 5), (1, 100300, 7), (2, 100301, 0), (3, 100302, 2)]
+        for slot_id, config_id, num in stock:
+            repo.upsert_slot_state(
+                SlotState(
+                    page_id=102,
+                    slot_id=slot_id,
+                    config_base_id=config_id,
+                    num=num,
+                    updated_at=datetime.now(),
+                    player_id="p1",
+                )
+            )
+
+        assert repo.get_inventory_totals() == {100300: 12, 100302: 2}
+
 
 class TestItemsRepository:
     """Tests for items CRUD."""
@@ -297,6 +377,135 @@ class TestItemsRepository:
 
         assert repo.get_item_count() == 5
 
+    def test_upsert_items_batch_from_generator(self, repo):
+        items = (
+            Item(
+                config_base_id=i,
+                name_en=f"Item_{i}",
+                name_cn=None,
+                type_cn=None,
+                icon_url=None,
+                url_en=None,
+                url_cn=None,
+            )
+            for i in range(100, 103)
+        )
+        repo.upsert_items_batch(items)
+
+        assert [repo.get_item(i).name_en for i in range(100, 103)] == [
+            "Item_100",
+            "Item_101",
+            "Item_102",
+        ]
+
+    def test_sync_items_from_cloud(self, repo):
+        cloud_items = [
+            {"config_base_id": 900001, "name_en": "Cloud A", "type_en": "currency"},
+            {"config_base_id": 900002, "name_en": "Cloud B", "url_tlidb": "https://x"},
+        ]
+        synced = repo.sync_items_from_cloud(cloud_items)
+
+        assert synced == 2
+        item = repo.get_item(900001)
+        assert item.name_en == "Cloud A"
+        assert item.type_cn == "currency"
+        assert repo.get_item(900002).url_en == "https://x"
+
+    def test_sync_items_from_cloud_empty(self, repo):
+        assert repo.sync_items_from_cloud([]) == 0
+
+    def test_sync_items_from_cloud_concurrent_with_price_writes(self, repo):
+        """Cloud item sync shares the connection with other writers."""
+        errors = []
+
+        def sync_items():
+            try:
+                for i in range(50):
+                    repo.sync_items_from_cloud(
+                        [
+                            {"config_base_id": 900000 + n, "name_en": f"Cloud {i}"}
+                            for n in range(200)
+                        ]
+                    )
+            except Exception as e:
+                errors.append(e)
+
+        def write_prices():
+            try:
+                for i in range(50):
+                    repo.upsert_prices_batch(
+                        [Price(config_base_id=900001, price_fe=float(i),
+                               source="manual", updated_at=datetime.now())]
+                    )
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=sync_items), threading.Thread(target=write_prices)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert repo.get_item(900001).name_en == "Cloud 49"
+
+    def test_get_items_bulk(self, repo):
+        repo.sync_items_from_cloud(
+            [{"config_base_id": 900000 + i, "name_en": f"Bulk_{i}"} for i in range(1000)]
+        )
+
+        ids = [900000 + i for i in range(1000)] + [999999999]
+        items = repo.get_items_bulk(ids)
+
+        assert len(items) == 1000
+        assert items[900999].name_en == "Bulk_999"
+        assert 999999999 not in items
+
+    def test_search_item_ids(self, repo):
+        repo.sync_items_from_cloud(
+            [
+                {"config_base_id": 900002, "name_en": "Zeta Qxshard"},
+                {"config_base_id": 900001, "name_en": "alpha qxshard", "name_cn": "测试测试碎片"},
+            ]
+        )
+
+        ids = repo.search_item_ids("QXSHARD")
+        assert ids == [900002, 900001]  # ordered by name_en (binary, like the old sort)
+        assert repo.search_item_ids("测试测试") == [900001]
+
+        # Writes through the repository invalidate the cached index
+        repo.update_item_name(900002, "Omega Qxshard")
+        assert repo.search_item_ids("omega qx") == [900002]
+
+    def test_search_index_read_during_write_is_not_kept(self, repo, monkeypatch):
+        repo.sync_items_from_cloud([{"config_base_id": 900001, "name_en": "Before"}])
+        execute = repo.db.execute
+
+        def execute_after_read(sql, params=()):
+            # A concurrent search landing just before the write rebuilds the index
+            repo.search_item_ids()
+            return execute(sql, params)
+
+        monkeypatch.setattr(repo.db, "execute", execute_after_read)
+        repo.update_item_name(900001, "Qxafter")
+
+        assert repo.search_item_ids("qxafter") == [900001]
+
+    def test_items_revision_read_during_write_is_not_kept(self, repo, monkeypatch):
+        repo.sync_items_from_cloud([{"config_base_id": 900001, "name_en": "Before"}])
+        execute = repo.db.execute
+        seen = []
+
+        def execute_after_read(sql, params=()):
+            # A concurrent listing landing just before the write takes its ETag here
+            seen.append(repo.items_revision())
+            return execute(sql, params)
+
+        monkeypatch.setattr(repo.db, "execute", execute_after_read)
+        repo.update_item_name(900001, "After")
+
+        assert repo.items_revision() not in seen
+
 
 class TestPricesRepository:
     """Tests for prices CRUD."""
@@ -314,6 +523,47 @@ class TestPricesRepository:
         assert fetched is not None
         assert fetched.price_fe == 1.0
 
+    def test_effective_prices_bulk_matches_single(self, repo):
+        repo.upsert_price(
+            Price(config_base_id=200001, price_fe=2.5, source="exchange", updated_at=datetime.now())
+        )
+        repo.upsert_price(
+            Price(config_base_id=200002, price_fe=4.0, source="manual", updated_at=datetime.now())
+        )
+
+        ids = [200001, 200002, 999999]
+        bulk = repo.get_effective_prices_with_source_bulk(ids)
+
+        assert bulk == {i: repo.get_effective_price_with_source(i) for i in ids}
+        assert bulk[200001] == (2.5, "exchange")
+
+
+    def test_upsert_prices_batch_concurrent_threads(self, repo):
+        """Overlapping batch upserts on one shared connection must not nest transactions."""
+        errors = []
+
+        def writer(offset):
+            try:
+                for i in range(100):
+                    repo.upsert_prices_batch(
+                        [Price(config_base_id=300000 + offset, price_fe=float(i),
+                               source="manual", updated_at=datetime.now())]
+                    )
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert repo.get_price(300003).price_fe == 99.0
+
+    def test_upsert_prices_batch_empty_generator(self, repo):
+        repo.upsert_prices_batch(p for p in [])
+
 
 class TestLogPositionRepository:
     """Tests for log position CRUD."""
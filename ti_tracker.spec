@@ -62,6 +62,7 @@ hiddenimports = [
     'email_validator',
     'httptools',
     'watchfiles',
+    'orjson',
     'websockets',
     # pywebview for native window
     'webview',